@@ -1,10 +1,29 @@
 """NetLoom - Network topology orchestrator."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+
 __version__ = "0.3.0"
 
-from .core.application import Application
-from .core.controller import BaseController
-from .core.model import DisplayModel
+if TYPE_CHECKING:
+    from .core.application import Application
+    from .core.controller import BaseController
+    from .core.model import DisplayModel
+
+# Public names resolved on first access (PEP 562), so importing the package stays cheap
+_LAZY_IMPORTS: dict[str, str] = {
+    "Application": ".core.application",
+    "BaseController": ".core.controller",
+    "DisplayModel": ".core.model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
 
 
 __all__ = [
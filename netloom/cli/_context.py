@@ -0,0 +1,30 @@
+"""Typed state shared by CLI commands through ``ctx.obj``."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import rich_click as click
+
+
+if TYPE_CHECKING:
+    from ..core.application import Application
+    from ..models.internal import InternalTopology
+
+
+@dataclass(slots=True)
+class CliContext:
+    """State built by the root group callback and passed to every command."""
+
+    app: "Application"
+    workdir: Path
+    internal: "InternalTopology | None" = None
+    """Converted topology; ``None`` when the command does not need one."""
+
+    @property
+    def topology(self) -> "InternalTopology":
+        """Converted topology, for commands that need one."""
+
+        if self.internal is None:
+            raise click.UsageError("--topology is required.")
+        return self.internal
@@ -1,17 +1,24 @@
 """CLI group definition and global options."""
 
+import os
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import orjson
 import rich_click as click
 
-from netloom.models.common import load_topology
-from netloom.models.converters import convert_topology
+from netloom import __version__
 
 from ..core.application import Application
 from ..core.vbox import VBoxSettings
+from ._context import CliContext
 from ._paramtypes import DirectoryType, OvaFileType, TopologyFileType
 
 
+if TYPE_CHECKING:
+    from netloom.models.internal import InternalTopology
+
+
 click.rich_click.USE_RICH_MARKUP = True
 click.rich_click.SHOW_ARGUMENTS = True
 click.rich_click.GROUP_ARGUMENTS_OPTIONS = True
@@ -32,12 +39,99 @@ click.rich_click.COMMAND_GROUPS = {
 }
 
 
-@click.group(context_settings={"help_option_names": ["-h", "--help"]})
+# Converted topology cached in the workdir, reused while the topology file is unchanged
+_INTERNAL_CACHE_NAME = ".netloom_internal.json"
+
+# Packages whose code shapes the converted topology; see _sources_fingerprint
+_CONVERTER_PACKAGES = ("models", "core")
+
+# Subcommands that never read the topology, so the group callback skips loading it
+_TOPOLOGY_FREE_COMMANDS = frozenset({"install-completion", "list-templates"})
+
+
+class NetLoomGroup(click.RichGroup):
+    """Root group that notes when the resolved subcommand will only print its help."""
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        cmd_name, cmd, rest = super().resolve_command(ctx, args)
+        ctx.meta["netloom.help_only"] = any(arg in ctx.help_option_names for arg in rest) or (
+            isinstance(cmd, click.Group) and not rest
+        )
+        return cmd_name, cmd, rest
+
+
+def _sources_fingerprint() -> list[list[Any]]:
+    """Return ``[name, mtime_ns, size]`` of every module in the converter packages.
+
+    Part of the cache key, so editing the models or the converter (e.g. on an editable install)
+    invalidates the cached topology even when ``__version__`` stays the same.
+    """
+
+    root = Path(__file__).resolve().parent.parent
+    fingerprint: list[list[Any]] = []
+    for package in _CONVERTER_PACKAGES:
+        try:
+            with os.scandir(root / package) as it:
+                entries = [e for e in it if e.name.endswith(".py")]
+        except OSError:  # e.g. running from a zip archive; fall back to the version alone
+            continue
+        for entry in sorted(entries, key=lambda e: e.name):
+            st = entry.stat()
+            fingerprint.append([f"{package}/{entry.name}", st.st_mtime_ns, st.st_size])
+    return fingerprint
+
+
+def _load_internal(topo_path: str, workdir: str) -> "InternalTopology":
+    """Load and convert the topology, reusing the workdir cache when the file is unchanged."""
+
+    # Imported here: the models pull in pydantic, which help and completion never need
+    from pydantic import ValidationError
+
+    from netloom.models.internal import InternalTopology
+
+    st = Path(topo_path).stat()
+    key: list[Any] = [
+        __version__,
+        _sources_fingerprint(),
+        str(Path(topo_path).resolve()),
+        st.st_mtime_ns,
+        st.st_size,
+        workdir,
+    ]
+    cache = Path(workdir) / _INTERNAL_CACHE_NAME
+
+    # Cache layout: the JSON key on the first line, then the dumped model, which pydantic-core
+    # parses and validates in one pass without building an intermediate dict
+    try:
+        head, _, body = cache.read_bytes().partition(b"\n")
+        if orjson.loads(head) == key:
+            return InternalTopology.model_validate_json(body)
+    except (OSError, orjson.JSONDecodeError, ValidationError):
+        pass
+
+    # Only a cache miss needs the config models and the converter
+    from netloom.models.common import load_topology
+    from netloom.models.converters import convert_topology
+
+    internal = convert_topology(load_topology(topo_path), workdir=workdir)
+    # Only cache into an existing workdir; read-only commands must not create it
+    if cache.parent.is_dir():
+        try:
+            cache.write_bytes(orjson.dumps(key) + b"\n" + internal.model_dump_json().encode())
+        except OSError:
+            pass
+
+    return internal
+
+
+@click.group(cls=NetLoomGroup, context_settings={"help_option_names": ["-h", "--help"]})
 @click.option(
     "--topology",
     "topo_path",
     type=TopologyFileType(),
-    help="Path to topology YAML.",
+    help="Path to topology YAML (or JSON).",
 )
 @click.option(
     "--workdir",
@@ -73,6 +167,20 @@ click.rich_click.COMMAND_GROUPS = {
     show_default=True,
     help="Snapshot used for linked clones.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=4,
+    show_default=True,
+    type=click.IntRange(min=1),
+    help="Maximum number of VMs to operate on, and config-generation processes to run, in parallel.",
+)
+@click.option(
+    "--no-template-cache",
+    is_flag=True,
+    default=False,
+    help="Do not cache compiled templates in the user cache directory.",
+)
 @click.option(
     "--debug",
     is_flag=True,
@@ -83,17 +191,23 @@ click.rich_click.COMMAND_GROUPS = {
 def cli(
     ctx: click.Context,
     topo_path: str | None,
-    workdir: Path,
+    workdir: str,
     basefolder: str | None,
     ova_path: str | None,
     base_vm_name: str,
     snapshot_name: str,
+    jobs: int,
+    no_template_cache: bool,
     debug: bool,
 ) -> None:
     """NetLoom topology orchestrator."""
 
-    if ctx.invoked_subcommand == "install-completion":
-        ctx.obj = {"app": Application.current()}
+    if (
+        ctx.resilient_parsing
+        or ctx.invoked_subcommand in _TOPOLOGY_FREE_COMMANDS
+        or ctx.meta.get("netloom.help_only", False)
+    ):
+        ctx.obj = CliContext(app=Application.current(), workdir=Path(workdir))
         return
 
     if not topo_path:
@@ -102,19 +216,15 @@ def cli(
     app = Application.current()
     app.workdir = Path(workdir)
     app.debug = debug
+    app.template_cache = not no_template_cache
 
-    vbox_settings = VBoxSettings(base_vm_name=base_vm_name, snapshot_name=snapshot_name)
+    vbox_settings = VBoxSettings(base_vm_name=base_vm_name, snapshot_name=snapshot_name, jobs=jobs)
     if basefolder:
         vbox_settings.basefolder = Path(basefolder)
     if ova_path:
         vbox_settings.ova_path = Path(ova_path)
     app.vbox_settings = vbox_settings
 
-    internal = convert_topology(load_topology(topo_path), workdir=workdir)
-    app.workdir.mkdir(parents=True, exist_ok=True)
+    internal = _load_internal(topo_path, workdir)
 
-    ctx.obj = {
-        "app": app,
-        "internal": internal,
-        "workdir": app.workdir,
-    }
+    ctx.obj = CliContext(app=app, internal=internal, workdir=app.workdir)
@@ -1,5 +1,7 @@
 """Custom Click paramtypes with shell completion support."""
 
+import os
+import stat
 from pathlib import Path
 
 import rich_click as click
@@ -21,16 +23,28 @@ def _parse_incomplete_path(incomplete: str) -> tuple[Path, str, str]:
     return parent, prefix, stem_filter
 
 
-def _file_completions(incomplete: str, extensions: set[str]) -> list[CompletionItem]:
-    """Return completion items for files with the given extensions."""
+def _stat_mode(path: str) -> int | None:
+    """Return the ``st_mode`` of *path* from a single ``stat()``, or ``None`` if it does not exist.
+
+    Like ``os.path.exists``, any ``stat()`` failure (symlink loop, bad path, ...) counts as missing.
+    """
+
+    try:
+        return os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+
+
+def _file_completions(incomplete: str, suffixes: tuple[str, ...]) -> list[CompletionItem]:
+    """Return completion items for files ending in one of *suffixes* (lowercase), plus directories."""
 
     parent, prefix, stem_filter = _parse_incomplete_path(incomplete)
     completions: list[CompletionItem] = []
     try:
-        for item in sorted(parent.iterdir(), key=lambda p: (p.is_file(), p.name)):
-            if not item.name.startswith(stem_filter):
-                continue
-            if item.is_file() and item.suffix.lower() in extensions:
+        with os.scandir(parent) as it:
+            entries = [e for e in it if e.name.startswith(stem_filter)]
+        for item in sorted(entries, key=lambda e: (e.is_file(), e.name)):
+            if item.is_file() and item.name.lower().endswith(suffixes):
                 completions.append(CompletionItem(prefix + item.name))
             elif item.is_dir():
                 completions.append(CompletionItem(prefix + item.name + "/"))
@@ -42,36 +56,40 @@ def _file_completions(incomplete: str, extensions: set[str]) -> list[CompletionI
 
 class TopologyFileType(click.ParamType):
     name = "topology_file"
+    _SUFFIXES = (".yaml", ".yml", ".json")
 
     def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> list[CompletionItem]:
-        return _file_completions(incomplete, {".yaml", ".yml"})
+        return _file_completions(incomplete, self._SUFFIXES)
 
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> str:
-        path = Path(value).expanduser()
-        if not path.exists():
+        path = os.path.expanduser(value)
+        mode = _stat_mode(path)
+        if mode is None:
             self.fail(f"Topology file does not exist: {value}", param, ctx)
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             self.fail(f"Path is not a file: {value}", param, ctx)
-        if path.suffix.lower() not in (".yaml", ".yml"):
-            self.fail(f"Topology file must be a YAML file (.yaml or .yml): {value}", param, ctx)
-        return str(path)
+        if not os.path.basename(path).lower().endswith(self._SUFFIXES):
+            self.fail(f"Topology file must be a YAML or JSON file (.yaml, .yml or .json): {value}", param, ctx)
+        return path
 
 
 class OvaFileType(click.ParamType):
     name = "ova_file"
+    _SUFFIXES = (".ova",)
 
     def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> list[CompletionItem]:
-        return _file_completions(incomplete, {".ova"})
+        return _file_completions(incomplete, self._SUFFIXES)
 
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> str:
-        path = Path(value).expanduser()
-        if not path.exists():
+        path = os.path.expanduser(value)
+        mode = _stat_mode(path)
+        if mode is None:
             self.fail(f"OVA file does not exist: {value}", param, ctx)
-        if not path.is_file():
+        if not stat.S_ISREG(mode):
             self.fail(f"Path is not a file: {value}", param, ctx)
-        if path.suffix.lower() != ".ova":
+        if not os.path.basename(path).lower().endswith(self._SUFFIXES):
             self.fail(f"File must be an OVA file (.ova): {value}", param, ctx)
-        return str(path)
+        return path
 
 
 class DirectoryType(click.ParamType):
@@ -85,21 +103,22 @@ class DirectoryType(click.ParamType):
         parent, prefix, stem_filter = _parse_incomplete_path(incomplete)
         completions: list[CompletionItem] = []
         try:
-            for item in sorted(parent.iterdir(), key=lambda p: p.name):
-                if item.is_dir() and item.name.startswith(stem_filter):
-                    completions.append(CompletionItem(prefix + item.name + "/"))
+            with os.scandir(parent) as it:
+                names = sorted(e.name for e in it if e.name.startswith(stem_filter) and e.is_dir())
+            completions = [CompletionItem(prefix + name + "/") for name in names]
         except (FileNotFoundError, NotADirectoryError, PermissionError):
             pass
 
         return completions
 
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> str:
-        path = Path(value).expanduser()
-        if self.must_exist and not path.exists():
+        path = os.path.expanduser(value)
+        mode = _stat_mode(path)
+        if self.must_exist and mode is None:
             self.fail(f"Directory does not exist: {value}", param, ctx)
-        if path.exists() and not path.is_dir():
+        if mode is not None and not stat.S_ISDIR(mode):
             self.fail(f"Path exists but is not a directory: {value}", param, ctx)
-        return str(path)
+        return path
 
 
 class TemplateSetType(click.ParamType):
@@ -107,7 +126,7 @@ class TemplateSetType(click.ParamType):
 
     def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> list[CompletionItem]:
         try:
-            app = ctx.obj["app"] if ctx and ctx.obj else None
+            app = ctx.obj.app if ctx and ctx.obj else None
             if app is None:
                 from ..core.application import Application
 
@@ -118,9 +137,9 @@ class TemplateSetType(click.ParamType):
             return []
 
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> str:
-        if not (ctx and ctx.obj and "app" in ctx.obj):
+        if not (ctx and ctx.obj):
             return value
-        app = ctx.obj["app"]
+        app = ctx.obj.app
         try:
             templates = app.config.list_template_sets()
         except Exception as e:
@@ -135,21 +154,21 @@ class NodeNameType(click.ParamType):
 
     def shell_complete(self, ctx: click.Context, param: click.Parameter, incomplete: str) -> list[CompletionItem]:
         try:
-            if ctx and ctx.obj and "internal" in ctx.obj:
-                internal = ctx.obj["internal"]
+            if ctx and ctx.obj and ctx.obj.internal is not None:
+                internal = ctx.obj.internal
                 return [CompletionItem(n.name) for n in internal.nodes if n.name.startswith(incomplete)]
         except Exception:  # noqa: S110
             pass
         return []
 
     def convert(self, value: str, param: click.Parameter | None, ctx: click.Context | None) -> str:
-        if not (ctx and ctx.obj and "internal" in ctx.obj):
+        if not (ctx and ctx.obj and ctx.obj.internal is not None):
             return value
-        internal = ctx.obj["internal"]
+        internal = ctx.obj.internal
         try:
             node_names = [n.name for n in internal.nodes]
         except Exception as e:
             self.fail(f"Failed to load node list: {e}", param, ctx)
-        if value not in set(node_names):
+        if value not in node_names:
             self.fail(f"Unknown node '{value}'. Available: {', '.join(node_names)}", param, ctx)
         return value
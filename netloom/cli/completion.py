@@ -5,68 +5,65 @@ from pathlib import Path
 import rich_click as click
 
 from ..core.application import Application
+from ._context import CliContext
 from ._group import cli
 
 
+_COMPLETION_MARKER = "# NetLoom completion"
+
+# shell -> (config file relative to $HOME, line that enables completion)
+_COMPLETION_LINES: dict[str, tuple[str, str]] = {
+    "bash": (".bashrc", 'eval "$(_NETLOOM_COMPLETE=bash_source netloom)"'),
+    "zsh": (".zshrc", 'eval "$(_NETLOOM_COMPLETE=zsh_source netloom)"'),
+    "fish": (".config/fish/config.fish", "eval (env _NETLOOM_COMPLETE=fish_source netloom)"),
+}
+
+
 @cli.command("install-completion")
 @click.option(
     "--install",
     "install_shell",
-    type=click.Choice(["bash", "zsh", "fish"], case_sensitive=False),
+    type=click.Choice(list(_COMPLETION_LINES), case_sensitive=False),
     help="Install completion script for the specified shell.",
 )
 @click.pass_obj
-def install_completion(obj: dict | None, install_shell: str | None) -> None:
+def install_completion(obj: CliContext, install_shell: str | None) -> None:
     """Generate or install shell completion scripts for netloom."""
 
-    app = Application.current()
+    app: Application = obj.app
 
     if install_shell:
         shell = install_shell.lower()
-        home = Path.home()
-
-        if shell == "bash":
-            config_file = home / ".bashrc"
-            completion_line = 'eval "$(_NETLOOM_COMPLETE=bash_source netloom)"'
-        elif shell == "zsh":
-            config_file = home / ".zshrc"
-            completion_line = 'eval "$(_NETLOOM_COMPLETE=zsh_source netloom)"'
-        elif shell == "fish":
-            config_dir = home / ".config" / "fish"
-            config_dir.mkdir(parents=True, exist_ok=True)
-            config_file = config_dir / "config.fish"
-            completion_line = "eval (env _NETLOOM_COMPLETE=fish_source netloom)"
-        else:
-            raise ValueError(f"Unsupported shell: {shell}")
+        try:
+            rel_path, completion_line = _COMPLETION_LINES[shell]
+        except KeyError:
+            raise ValueError(f"Unsupported shell: {shell}") from None
+        config_file = Path.home() / rel_path
 
         try:
             config_file.parent.mkdir(parents=True, exist_ok=True)
 
-            try:
-                if "# NetLoom completion" in config_file.read_text(encoding="utf-8"):
-                    app.console.print(f"[yellow]Completion already installed in {config_file}[/yellow]")
+            # One handle both checks for an existing install and appends the snippet
+            with open(config_file, "a+", encoding="utf-8") as f:
+                f.seek(0)
+                if _COMPLETION_MARKER in f.read():
+                    app.warn(f"Completion already installed in {config_file}")
                     return
-            except FileNotFoundError:
-                pass
-
-            with open(config_file, "a", encoding="utf-8") as f:
-                f.write(f"\n# NetLoom completion\n{completion_line}\n")
+                f.write(f"\n{_COMPLETION_MARKER}\n{completion_line}\n")
 
-            app.console.print(f"[green]✓ Completion installed for {shell}[/green]")
+            app.ok(f"✓ Completion installed for {shell}")
             app.console.print(f"[dim]Added to: {config_file}[/dim]")
         except OSError as e:
-            app.console.print(f"[red]Error: {e}[/red]")
-            app.console.print(f"[yellow]Add manually to {config_file}:[/yellow]")
+            app.error(f"Error: {e}")
+            app.warn(f"Add manually to {config_file}:")
             app.console.print(f"  {completion_line}")
             raise click.ClickException("Completion installation failed.")
     else:
         app.console.print("[bold]Shell Completion Setup[/bold]\n")
         app.console.print("Add one of the following to your shell config:\n")
-        app.console.print("[cyan]Bash (~/.bashrc):[/cyan]")
-        app.console.print('  eval "$(_NETLOOM_COMPLETE=bash_source netloom)"')
-        app.console.print("\n[cyan]Zsh (~/.zshrc):[/cyan]")
-        app.console.print('  eval "$(_NETLOOM_COMPLETE=zsh_source netloom)"')
-        app.console.print("\n[cyan]Fish (~/.config/fish/config.fish):[/cyan]")
-        app.console.print("  eval (env _NETLOOM_COMPLETE=fish_source netloom)")
+        for i, (shell, (rel_path, completion_line)) in enumerate(_COMPLETION_LINES.items()):
+            prefix = "\n" if i else ""
+            app.console.print(f"{prefix}[cyan]{shell.capitalize()} (~/{rel_path}):[/cyan]")
+            app.console.print(f"  {completion_line}")
         app.console.print("\n[yellow]Or use --install to handle both steps automatically:[/yellow]")
         app.console.print("  netloom install-completion --install bash")
@@ -3,10 +3,9 @@
 import rich_click as click
 from rich.prompt import Confirm
 
-from netloom.models.internal import InternalTopology
-
 from ..core.application import Application
 from ..core.enums import RoutingEngine, TemplateSet
+from ._context import CliContext
 from ._group import cli
 from ._paramtypes import NodeNameType
 
@@ -26,22 +25,22 @@ def steps(ctx: click.Context) -> None:
 
 @steps.command("init")
 @click.pass_obj
-def init(obj: dict) -> None:
+def init(obj: CliContext) -> None:
     """Import base OVA and take a snapshot."""
 
-    app: Application = obj["app"]
-    app.infrastructure.init(obj["internal"], obj["workdir"])
-    app.console.print("[green]✓ Initialized base VM and workdir.[/green]")
+    app: Application = obj.app
+    app.infrastructure.init(obj.topology, obj.workdir)
+    app.ok("✓ Initialized base VM and workdir.")
 
 
 @steps.command("create")
 @click.pass_obj
-def create(obj: dict) -> None:
+def create(obj: CliContext) -> None:
     """Create clones and attach empty config-drives."""
 
-    app: Application = obj["app"]
-    app.infrastructure.create(obj["internal"])
-    app.console.print("[green]✓ Created linked clones and config-drives.[/green]")
+    app: Application = obj.app
+    app.infrastructure.create(obj.topology)
+    app.ok("✓ Created linked clones and config-drives.")
 
 
 @steps.command("gen")
@@ -54,7 +53,7 @@ def create(obj: dict) -> None:
     help="Generate config only for this node.",
 )
 @click.pass_obj
-def generate(obj: dict, node_name: str | None) -> None:
+def generate(obj: CliContext, node_name: str | None) -> None:
     """Generate configs for all nodes (or a single node with --node).
 
     The primary template set (networkd) is always rendered.
@@ -66,8 +65,10 @@ def generate(obj: dict, node_name: str | None) -> None:
     - wireguard when services.wireguard is configured
     """
 
-    app: Application = obj["app"]
-    internal: InternalTopology = obj["internal"]
+    from netloom.models.internal import InternalTopology
+
+    app: Application = obj.app
+    internal: InternalTopology = obj.topology
 
     if node_name:
         target = internal.get_node(node_name)
@@ -81,7 +82,7 @@ def generate(obj: dict, node_name: str | None) -> None:
             links=internal.links,
         )
         app.config.generate(single)
-        app.console.print(f"[green]✓ Config generated for node '{node_name}'.[/green]")
+        app.ok(f"✓ Config generated for node '{node_name}'.")
         return
 
     app.config.generate(internal)
@@ -95,37 +96,37 @@ def generate(obj: dict, node_name: str | None) -> None:
         if node.services and node.services.wireguard:
             rendered.add(TemplateSet.WIREGUARD)
 
-    app.console.print(f"[green]✓ Templates rendered: {', '.join(sorted(rendered))}[/green]")
+    app.ok(f"✓ Templates rendered: {', '.join(sorted(rendered))}")
 
 
 @steps.command("attach")
 @click.pass_obj
-def attach(obj: dict) -> None:
+def attach(obj: CliContext) -> None:
     """Copy generated configs into each node's config-drive."""
 
-    app: Application = obj["app"]
-    app.config.attach(obj["internal"])
-    app.console.print("[green]✓ Config-drives populated.[/green]")
+    app: Application = obj.app
+    app.config.attach(obj.topology)
+    app.ok("✓ Config-drives populated.")
 
 
 @steps.command("start")
 @click.pass_obj
-def start(obj: dict) -> None:
+def start(obj: CliContext) -> None:
     """Start all topology VMs."""
 
-    app: Application = obj["app"]
-    app.infrastructure.start(obj["internal"])
-    app.console.print("[green]✓ VMs started.[/green]")
+    app: Application = obj.app
+    app.infrastructure.start(obj.topology)
+    app.ok("✓ VMs started.")
 
 
 @steps.command("stop")
 @click.pass_obj
-def stop(obj: dict) -> None:
+def stop(obj: CliContext) -> None:
     """Send stop signals to all topology VMs."""
 
-    app: Application = obj["app"]
-    app.infrastructure.stop(obj["internal"])
-    app.console.print("[green]✓ Stop signals sent.[/green]")
+    app: Application = obj.app
+    app.infrastructure.stop(obj.topology)
+    app.ok("✓ Stop signals sent.")
 
 
 @steps.command("destroy")
@@ -137,13 +138,13 @@ def stop(obj: dict) -> None:
 )
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt.")
 @click.pass_obj
-def destroy(obj: dict, destroy_base: bool, yes: bool) -> None:
+def destroy(obj: CliContext, destroy_base: bool, yes: bool) -> None:
     """Stop and remove all topology VMs."""
 
-    app: Application = obj["app"]
+    app: Application = obj.app
     if not yes:
         if not Confirm.ask("[yellow]This will destroy all topology VMs.[/yellow] Proceed", console=app.console):
             raise click.Abort()
 
-    app.infrastructure.destroy(obj["internal"], destroy_base=destroy_base)
-    app.console.print("[green]✓ All VMs destroyed.[/green]")
+    app.infrastructure.destroy(obj.topology, destroy_base=destroy_base)
+    app.ok("✓ All VMs destroyed.")
@@ -1,14 +1,19 @@
 """Lifecycle commands: up, down."""
 
+from typing import TYPE_CHECKING
+
 import rich_click as click
 from rich.prompt import Confirm
 
-from netloom.models.internal import InternalTopology
-
 from ..core.application import Application
+from ._context import CliContext
 from ._group import cli
 
 
+if TYPE_CHECKING:
+    from netloom.models.internal import InternalTopology
+
+
 @cli.command()
 @click.option(
     "--init",
@@ -18,11 +23,13 @@ from ._group import cli
 )
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt.")
 @click.pass_obj
-def up(obj: dict, run_init: bool, yes: bool) -> None:
+def up(obj: CliContext, run_init: bool, yes: bool) -> None:
     """Bring topology up: (init →) create → gen → attach → start."""
 
-    app: Application = obj["app"]
-    internal: InternalTopology = obj["internal"]
+    app: Application = obj.app
+    internal: InternalTopology = obj.topology
+    infra = app.infrastructure
+    config = app.config
 
     steps = (["steps init"] if run_init else []) + ["steps create", "steps gen", "steps attach", "steps start"]
     app.console.print(f"[bold]Pipeline:[/bold] {' → '.join(steps)}")
@@ -33,32 +40,33 @@ def up(obj: dict, run_init: bool, yes: bool) -> None:
 
     if run_init:
         app.console.print("[dim]── init ──[/dim]")
-        app.infrastructure.init(internal, obj["workdir"])
+        infra.init(internal, obj.workdir)
 
     app.console.print("[dim]── create ──[/dim]")
-    app.infrastructure.create(internal)
+    infra.create(internal)
 
     app.console.print("[dim]── gen ──[/dim]")
-    app.config.generate(internal)
+    config.generate(internal)
 
     app.console.print("[dim]── attach ──[/dim]")
-    app.config.attach(internal)
+    config.attach(internal)
 
     app.console.print("[dim]── start ──[/dim]")
-    app.infrastructure.start(internal)
+    infra.start(internal)
 
-    app.console.print("[green]✓ Topology is up.[/green]")
+    app.ok("✓ Topology is up.")
 
 
 @cli.command()
 @click.option("--all", "destroy_base", is_flag=True, help="Also destroy the base VM.")
 @click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt.")
 @click.pass_obj
-def down(obj: dict, destroy_base: bool, yes: bool) -> None:
+def down(obj: CliContext, destroy_base: bool, yes: bool) -> None:
     """Tear topology down: stop → destroy."""
 
-    app: Application = obj["app"]
-    internal: InternalTopology = obj["internal"]
+    app: Application = obj.app
+    internal: InternalTopology = obj.topology
+    infra = app.infrastructure
 
     app.console.print("[bold]Pipeline:[/bold] stop → destroy")
     if not yes:
@@ -66,9 +74,9 @@ def down(obj: dict, destroy_base: bool, yes: bool) -> None:
             raise click.Abort()
 
     app.console.print("[dim]── stop ──[/dim]")
-    app.infrastructure.stop(internal)
+    infra.stop(internal)
 
     app.console.print("[dim]── destroy ──[/dim]")
-    app.infrastructure.destroy(internal, destroy_base=destroy_base)
+    infra.destroy(internal, destroy_base=destroy_base)
 
-    app.console.print("[green]✓ Topology is down.[/green]")
+    app.ok("✓ Topology is down.")
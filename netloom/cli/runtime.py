@@ -1,5 +1,7 @@
 """Runtime commands: status, connect."""
 
+from typing import TYPE_CHECKING
+
 import rich_click as click
 from rich.box import ROUNDED
 from rich.table import Table
@@ -7,11 +9,15 @@ from rich.table import Table
 from ..connect import run_bridge
 from ..core.application import Application
 from ..core.enums import VMState
-from ..models.internal import InternalTopology
+from ._context import CliContext
 from ._group import cli
 from ._paramtypes import NodeNameType
 
 
+if TYPE_CHECKING:
+    from ..models.internal import InternalTopology
+
+
 _STATE_STYLE: dict[str, str] = {
     VMState.RUNNING: "green",
     VMState.POWEROFF: "dim",
@@ -23,11 +29,11 @@ _STATE_STYLE: dict[str, str] = {
 @cli.command()
 @click.option("--node", "-n", "node_name", default=None, type=NodeNameType(), help="Show only this node.")
 @click.pass_obj
-def status(obj: dict, node_name: str | None) -> None:
+def status(obj: CliContext, node_name: str | None) -> None:
     """Show live VM state and UART connection port for each node."""
 
-    app: Application = obj["app"]
-    internal: InternalTopology = obj["internal"]
+    app: Application = obj.app
+    internal: InternalTopology = obj.topology
 
     rows = app.infrastructure.status(internal, node_name)
 
@@ -67,10 +73,10 @@ def status(obj: dict, node_name: str | None) -> None:
 @cli.command()
 @click.argument("node", type=NodeNameType())
 @click.pass_obj
-def connect(obj: dict, node: str) -> None:
+def connect(obj: CliContext, node: str) -> None:
     """Open an interactive serial console to NODE over its UART TCP port."""
 
-    app: Application = obj["app"]
+    app: Application = obj.app
     infra = app.infrastructure
 
     state = infra.get_vm_state(node)
@@ -84,7 +90,7 @@ def connect(obj: dict, node: str) -> None:
 
     endpoint = infra.get_connection_endpoint(node)
     if endpoint is None:
-        app.console.print(f"[red]UART1 on '{node}' is not in tcpserver mode; cannot connect.[/red]")
+        app.error(f"UART1 on '{node}' is not in tcpserver mode; cannot connect.")
         raise SystemExit(1)
 
     host, port = endpoint
@@ -1,17 +1,24 @@
 """Show command for topology information display."""
 
+from typing import TYPE_CHECKING
+
 import rich_click as click
 from rich.box import ROUNDED
+from rich.console import Group, RenderableType
 from rich.table import Table
 
-from netloom.models.internal import InternalTopology
 from netloom.utils.display import ROLE_COLOR, render_graph, render_map
 
 from ..core.application import Application
+from ._context import CliContext
 from ._group import cli
 from ._paramtypes import NodeNameType
 
 
+if TYPE_CHECKING:
+    from netloom.models.internal import InternalTopology
+
+
 @cli.command("show")
 @click.option("--node", "-n", "node_name", default=None, type=NodeNameType(), help="Show only this node.")
 @click.option("--routing", "-r", is_flag=True, help="Show routing config (static, OSPF, RIP).")
@@ -25,7 +32,7 @@ from ._paramtypes import NodeNameType
 @click.option("--graph", "-g", "show_graph", is_flag=True, help="Draw topology as a tree diagram.")
 @click.pass_obj
 def show_topology(
-    obj: dict,
+    obj: CliContext,
     node_name: str | None,
     routing: bool,
     services: bool,
@@ -47,8 +54,8 @@ def show_topology(
       netloom --topology lab.yaml show -n R1 -r  # routing info for R1
     """
 
-    app: Application = obj["app"]
-    internal: InternalTopology = obj["internal"]
+    app: Application = obj.app
+    internal: InternalTopology = obj.topology
 
     if show_map and show_graph:
         raise click.BadParameter("Choose only one of --map or --graph.", param_hint="--map/--graph")
@@ -69,10 +76,11 @@ def show_topology(
 
     nodes = [internal.get_node(node_name)] if node_name else internal.nodes
 
-    app.console.print(f"[bold]Topology:[/bold] {internal.name} [dim]({internal.id})[/dim]")
+    # Collected and printed in one call so Rich lays out the whole view in a single render pass
+    renderables: list[RenderableType] = [f"[bold]Topology:[/bold] {internal.name} [dim]({internal.id})[/dim]"]
     if internal.description:
-        app.console.print(f"[dim]{internal.description}[/dim]")
-    app.console.print()
+        renderables.append(f"[dim]{internal.description}[/dim]")
+    renderables.append("")
 
     table = Table(box=ROUNDED, show_header=True, border_style="dim", expand=False)
     table.add_column("Node", no_wrap=True)
@@ -142,13 +150,15 @@ def show_topology(
         detail_cell = "\n".join(detail_parts) if detail_parts else "[dim]—[/dim]"
         table.add_row(node_cell, iface_cell, detail_cell)
 
-    app.console.print(table)
+    renderables.append(table)
 
     if not node_name:
-        app.console.print()
-        app.console.print(
+        renderables.append("")
+        renderables.append(
             f"[dim]Nodes: {len(internal.nodes)}  •  "
             f"Networks: {len(internal.networks)}  •  "
             f"Links: {len(internal.links)}[/dim]"
         )
-        app.console.print("[dim]Use --map or --graph for a topology diagram.[/dim]")
+        renderables.append("[dim]Use --map or --graph for a topology diagram.[/dim]")
+
+    app.console.print(Group(*renderables))
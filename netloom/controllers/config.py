@@ -1,13 +1,29 @@
 """Config controller for template rendering and config-drive operations."""
 
+import atexit
+import os
+import shutil
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
 from functools import cached_property
 from importlib import resources
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import orjson
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    ChoiceLoader,
+    DictLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+)
 from jinja2.exceptions import TemplateNotFound
 
 from ..core.controller import BaseController
@@ -16,7 +32,92 @@ from ..core.enums import InterfaceKind, RoutingEngine, TemplateSet
 
 if TYPE_CHECKING:
     from ..core.application import Application
-    from ..models.internal import InternalNode, InternalTopology
+    from ..models.internal import InternalInterface, InternalNode, InternalTopology
+
+
+# Below this many nodes, starting worker processes costs more than rendering serially
+_PARALLEL_GENERATE_MIN_NODES = 16
+
+# Topology and search paths of a generate() worker process, set once by _init_generate_worker
+_worker_job: tuple["InternalTopology", list[Path] | None] | None = None
+
+
+def _init_generate_worker(
+    topo: "InternalTopology",
+    extra_paths: list[Path] | None,
+    debug: bool,
+    template_cache: bool,
+) -> None:
+    """Configure the worker's Application and remember the topology being generated."""
+
+    from ..core.application import Application
+
+    global _worker_job
+    app = Application.current()
+    app.debug = debug
+    app.template_cache = template_cache
+    # The parent prints every warning, so output order does not depend on worker scheduling
+    app.console.quiet = True
+    _worker_job = (topo, extra_paths)
+
+
+def _generate_node_in_worker(job: tuple[int, Path]) -> None:
+    """Generate configs for ``topo.nodes[index]`` into *outdir* inside a worker process."""
+
+    from ..core.application import Application
+
+    assert _worker_job is not None  # noqa: S101
+    topo, extra_paths = _worker_job
+    index, outdir = job
+    config = Application.current().config
+    config._generate_node(config.get_env(extra_paths), topo.nodes[index], topo, outdir)
+
+
+# Per-item placeholders that may appear in an _OUTPUT_PATHS entry
+_PLACEHOLDERS = ("iface", "vlan", "tunnel", "bridge")
+
+
+@dataclass(frozen=True, slots=True)
+class _CompiledTemplate:
+    """A template of a set, compiled once together with its output path mapping."""
+
+    stem: str
+    template: Template
+    directory: str
+    """Output directory relative to the node's outdir (see ``ConfigController._OUTPUT_PATHS``)."""
+    name: str
+    """Output file name, possibly containing a ``str.format`` placeholder."""
+    placeholder: str | None
+    """Per-item placeholder in ``name``, or ``None`` for one file per node."""
+
+
+@dataclass(frozen=True, slots=True)
+class _NodeIfaces:
+    """Interface subsets of one node, computed once and shared by every per-interface template."""
+
+    vlan_parents: list["InternalInterface"]
+    """Interfaces that carry VLANs (configured by ``vlan-parent.network``)."""
+    link: list["InternalInterface"]
+    """Configured interfaces that get a ``.link`` file: not loopback, with a MAC."""
+    network: list["InternalInterface"]
+    """Configured interfaces that get their own ``.network`` file: not bridge members or VLAN parents."""
+
+    @classmethod
+    def of(cls, node: "InternalNode") -> "_NodeIfaces":
+        parent_names = {vlan.parent for vlan in node.vlans}
+        configured = [iface for iface in node.interfaces if iface.configured]
+        return cls(
+            vlan_parents=[iface for iface in node.interfaces if iface.name in parent_names],
+            link=[i for i in configured if i.kind != InterfaceKind.LOOPBACK and i.mac_address],
+            network=[i for i in configured if i.bridge_name is None and i.name not in parent_names],
+        )
+
+
+def _user_cache_dir() -> Path:
+    """Per-user cache directory for netloom (XDG on POSIX, %LOCALAPPDATA% on Windows)."""
+
+    base = os.environ.get("LOCALAPPDATA" if os.name == "nt" else "XDG_CACHE_HOME")
+    return (Path(base) if base else Path.home() / ".cache") / "netloom"
 
 
 class ConfigController(BaseController["Application"]):
@@ -56,39 +157,86 @@ class ConfigController(BaseController["Application"]):
 
     def __init__(self, app: "Application") -> None:
         super().__init__(app)
-        self._env: Environment | None = None
+        self._envs: dict[tuple[Path, ...], Environment] = {}
+        self._compiled_sets: dict[tuple[Environment, str], list[_CompiledTemplate] | None] = {}
 
     @cached_property
     def templates_dir(self) -> Path:
         """Get the templates directory path."""
 
-        with resources.as_file(resources.files("netloom") / "templates") as templates_path:
-            return templates_path
+        templates = resources.files("netloom") / "templates"
+        if isinstance(templates, Path):
+            return templates
+
+        # Zipped install: extract once and keep the copy until the process exits,
+        # since the path from as_file() is only valid inside its context
+        stack = ExitStack()
+        atexit.register(stack.close)
+        return stack.enter_context(resources.as_file(templates))
+
+    @cached_property
+    def _builtin_sources(self) -> dict[str, str]:
+        """Source of every packaged template keyed by loader name, read once so lookups skip the filesystem."""
+
+        return {
+            path.relative_to(self.templates_dir).as_posix(): path.read_bytes().decode("utf-8")
+            for path in self.templates_dir.rglob("*.j2")
+        }
+
+    @cached_property
+    def _bytecode_cache(self) -> BytecodeCache | None:
+        """On-disk cache of compiled templates, or ``None`` when disabled or unavailable."""
+
+        if not self.app.template_cache:
+            return None
+        directory = _user_cache_dir() / "jinja"
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return None
+        # Compiled code bakes in the autoescape setting, which Jinja leaves out of the cache key;
+        # the suffix keeps these entries apart from ones compiled with autoescaping on
+        return FileSystemBytecodeCache(str(directory), pattern="%s.noescape.cache")
 
     def get_env(self, extra_paths: list[Path] | None = None) -> Environment:
-        """Get or create the Jinja2 environment."""
-
-        search_paths = [self.templates_dir]
-        if extra_paths:
-            search_paths.extend(extra_paths)
-
-        return Environment(
-            loader=FileSystemLoader([str(p) for p in search_paths]),
-            autoescape=True,
-            undefined=StrictUndefined,
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        """Get or create the Jinja2 environment.
+
+        One environment is built per distinct search path on each controller, so
+        compiled templates are reused across ``generate()`` calls.
+        """
+
+        search_paths = (self.templates_dir, *(extra_paths or ()))
+        env = self._envs.get(search_paths)
+        if env is None:
+            loader: BaseLoader = DictLoader(self._builtin_sources)
+            if extra_paths:
+                loader = ChoiceLoader([loader, FileSystemLoader([str(p) for p in extra_paths])])
+            env = self._envs[search_paths] = Environment(
+                loader=loader,
+                autoescape=False,  # noqa: S701
+                undefined=StrictUndefined,
+                trim_blocks=True,
+                lstrip_blocks=True,
+                auto_reload=False,
+                bytecode_cache=self._bytecode_cache,
+            )
+
+        return env
+
+    @cached_property
+    def _template_sets(self) -> tuple[str, ...]:
+        """Template set names, scanned once per controller."""
+
+        try:
+            with os.scandir(self.templates_dir) as it:
+                return tuple(sorted(e.name for e in it if e.is_dir() and not e.name.startswith("_")))
+        except FileNotFoundError:
+            return ()
 
     def list_template_sets(self) -> list[str]:
         """List available template sets."""
 
-        sets = []
-        if self.templates_dir.exists():
-            for item in self.templates_dir.iterdir():
-                if item.is_dir() and not item.name.startswith("_"):
-                    sets.append(item.name)
-        return sorted(sets)
+        return list(self._template_sets)
 
     def generate(
         self,
@@ -97,43 +245,86 @@ class ConfigController(BaseController["Application"]):
     ) -> None:
         """Generate configs for all nodes using a template set."""
 
+        # Output directory of every node that has one, keyed by the node's index
+        outdirs = {i: Path(node.config_dir) for i, node in enumerate(topo.nodes) if node.config_dir}
+        workers = min(self.app.vbox_settings.jobs, os.cpu_count() or 1, len(outdirs))
+
+        # Warnings are printed here, in node order, before any rendering starts
+        needed: set[TemplateSet] = set()
+        for i in outdirs:
+            node = topo.nodes[i]
+            needed.update(self._node_template_sets(node))
+            if node.services and node.services.wireguard:
+                self.console.print(
+                    f"  [yellow]Warning: WireGuard private key for '{node.name}' "
+                    "will be written to config drive in plaintext.[/yellow]"
+                )
         env = self.get_env(extra_paths)
+        for template_set in TemplateSet:
+            if template_set in needed:
+                self._compile_template_set(env, template_set)
+
+        # Rendering is CPU-bound under the GIL, so larger topologies fan out to worker processes
+        if len(outdirs) < _PARALLEL_GENERATE_MIN_NODES or workers <= 1:
+            for i, outdir in outdirs.items():
+                self._generate_node(env, topo.nodes[i], topo, outdir)
+            return
 
-        for node in topo.nodes:
-            if not node.config_dir:
-                continue
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_generate_worker,
+            initargs=(topo, extra_paths, self.app.debug, self.app.template_cache),
+        ) as pool:
+            for _ in pool.map(_generate_node_in_worker, outdirs.items()):
+                pass
 
-            outdir = Path(node.config_dir)
-            outdir.mkdir(parents=True, exist_ok=True)
+    def _generate_node(self, env: Environment, node: "InternalNode", topo: "InternalTopology", outdir: Path) -> None:
+        """Render and write every config file for one node into *outdir*."""
 
-            context = {
-                "node": node,
-                "topology": topo,
-            }
+        outdir.mkdir(parents=True, exist_ok=True)
 
-            # Render the primary template set
-            self._render_template_set(env, TemplateSet.NETWORKD, context, outdir)
+        # One context per node: the render-item iterators set iface/vlan/tunnel/bridge in place
+        context = {
+            "node": node,
+            "topology": topo,
+            "iface": None,
+            "vlan": None,
+            "tunnel": None,
+            "bridge": None,
+        }
+        # Rendered files for this node, written in one pass once every set has rendered
+        outputs: dict[Path, str] = {}
+        ifaces = _NodeIfaces.of(node)
 
-            # Render BIRD templates if routing is configured with bird engine
-            if node.routing and node.routing.engine == RoutingEngine.BIRD and node.routing.configured:
-                self._render_template_set(env, TemplateSet.BIRD, context, outdir)
+        for template_set in self._node_template_sets(node):
+            self._render_template_set(env, template_set, context, outdir, outputs, ifaces)
 
-            # Render nftables templates if firewall is configured
-            if node.services and node.services.firewall:
-                self._render_template_set(env, TemplateSet.NFTABLES, context, outdir)
+        self._generate_services_list(env, node, outdir, outputs)
+        self._write_outputs(outputs)
 
-            # Render WireGuard templates if WireGuard is configured
-            if node.services and node.services.wireguard:
-                self.console.print(
-                    f"  [yellow]Warning: WireGuard private key for '{node.name}' "
-                    "will be written to config drive in plaintext.[/yellow]"
-                )
-                self._render_template_set(env, TemplateSet.WIREGUARD, context, outdir)
+        if self.app.debug:
+            self._write_debug_json(node, outdir)
 
-            self._generate_services_list(env, node, outdir)
+    @staticmethod
+    def _node_template_sets(node: "InternalNode") -> list[TemplateSet]:
+        """Template sets rendered for *node*, in render order."""
 
-            if self.app.debug:
-                self._write_debug_json(node, outdir)
+        # The primary template set is always rendered
+        sets = [TemplateSet.NETWORKD]
+
+        # BIRD templates if routing is configured with bird engine
+        if node.routing and node.routing.engine == RoutingEngine.BIRD and node.routing.configured:
+            sets.append(TemplateSet.BIRD)
+
+        # nftables templates if firewall is configured
+        if node.services and node.services.firewall:
+            sets.append(TemplateSet.NFTABLES)
+
+        # WireGuard templates if WireGuard is configured
+        if node.services and node.services.wireguard:
+            sets.append(TemplateSet.WIREGUARD)
+
+        return sets
 
     def _render_template_set(
         self,
@@ -141,129 +332,159 @@ class ConfigController(BaseController["Application"]):
         template_set: str,
         context: dict,
         outdir: Path,
+        outputs: dict[Path, str],
+        ifaces: "_NodeIfaces",
     ) -> None:
-        """Render all templates in a template set."""
+        """Render all templates in a template set into *outputs*."""
 
-        set_dir = self.templates_dir / template_set
-        if not set_dir.exists():
-            self.console.print(f"[yellow]Warning: Template set '{template_set}' not found[/yellow]")
+        compiled = self._compile_template_set(env, template_set)
+        if compiled is None:
             return
 
         node = context["node"]
 
-        for template_file in set_dir.glob("*.j2"):
-            template_name = f"{template_set}/{template_file.name}"
-            template = env.get_template(template_name)
-            template_stem = template_file.stem
+        for tpl in compiled:
+            directory = outdir / tpl.directory
+            items = self._iter_render_items(tpl.stem, tpl.placeholder, directory, tpl.name, node, context, ifaces)
+            for resolved_path, item_context in items:
+                content = tpl.template.render(item_context)
+                if content and not content.isspace():
+                    outputs[resolved_path] = content
 
-            output_path = self._get_output_path(template_stem, node, outdir)
-            if output_path is None:
-                continue
+    def _write_outputs(self, outputs: dict[Path, str]) -> None:
+        """Create each distinct parent directory once, then write every rendered file."""
 
-            for resolved_path, item_context in self._iter_render_items(template_stem, str(output_path), node, context):
-                content = template.render(item_context)
-                if content.strip():
-                    resolved_path.parent.mkdir(parents=True, exist_ok=True)
-                    resolved_path.write_text(content, encoding="utf-8", newline="\n")
+        for directory in sorted({path.parent for path in outputs}):
+            directory.mkdir(parents=True, exist_ok=True)
+        for path, content in outputs.items():
+            path.write_bytes(content.encode("utf-8"))
+
+    def _compile_template_set(
+        self,
+        env: Environment,
+        template_set: str,
+    ) -> list[_CompiledTemplate] | None:
+        """Scan and compile a template set once per environment; ``None`` if the set does not exist."""
+
+        key = (env, template_set)
+        if key in self._compiled_sets:
+            return self._compiled_sets[key]
+
+        set_dir = self.templates_dir / template_set
+        compiled: list[_CompiledTemplate] | None = None
+        if not set_dir.exists():
+            self.app.warn(f"Warning: Template set '{template_set}' not found")
+        else:
+            compiled = []
+            for template_file in set_dir.glob("*.j2"):
+                template_stem = template_file.stem
+                relative = self._get_output_path(template_stem)
+                if relative is None:
+                    continue
+                directory, _, name = relative.rpartition("/")
+                placeholder = next((p for p in _PLACEHOLDERS if f"{{{p}}}" in name), None)
+                template = env.get_template(f"{template_set}/{template_file.name}")
+                compiled.append(_CompiledTemplate(template_stem, template, directory, name, placeholder))
+
+        self._compiled_sets[key] = compiled
+        return compiled
 
     def _iter_render_items(
         self,
         template_stem: str,
-        output_path_str: str,
+        placeholder: str | None,
+        directory: Path,
+        name: str,
         node: "InternalNode",
         context: dict,
+        ifaces: "_NodeIfaces",
     ) -> Iterator[tuple[Path, dict]]:
         """Yield ``(resolved_output_path, render_context)`` for each item to render."""
 
-        if "{iface}" in output_path_str:
-            yield from self._iter_iface_items(template_stem, output_path_str, node, context)
-        elif "{vlan}" in output_path_str:
+        if placeholder == "iface":
+            yield from self._iter_iface_items(template_stem, directory, name, node, context, ifaces)
+        elif placeholder == "vlan":
             for vlan in node.vlans:
                 # Bridge-member VLANs are configured by bridge-port.network; skip their .network file
                 if template_stem == "vlan.network" and vlan.bridge_name is not None:
                     continue
-                yield Path(output_path_str.replace("{vlan}", vlan.name)), {**context, "vlan": vlan}
-        elif "{tunnel}" in output_path_str:
+                context["vlan"] = vlan
+                yield directory / name.format(vlan=vlan.name), context
+        elif placeholder == "tunnel":
             for tunnel in node.tunnels:
-                yield Path(output_path_str.replace("{tunnel}", tunnel.name)), {**context, "tunnel": tunnel}
-        elif "{bridge}" in output_path_str:
+                context["tunnel"] = tunnel
+                yield directory / name.format(tunnel=tunnel.name), context
+        elif placeholder == "bridge":
             for bridge in node.bridges:
                 if bridge.configured:
-                    yield Path(output_path_str.replace("{bridge}", bridge.name)), {**context, "bridge": bridge}
+                    context["bridge"] = bridge
+                    yield directory / name.format(bridge=bridge.name), context
         else:
-            yield Path(output_path_str), context
+            yield directory / name, context
 
     def _iter_iface_items(
         self,
         template_stem: str,
-        output_path_str: str,
+        directory: Path,
+        name: str,
         node: "InternalNode",
         context: dict,
+        ifaces: "_NodeIfaces",
     ) -> Iterator[tuple[Path, dict]]:
         """Yield ``(resolved_path, context)`` for per-interface template expansion."""
 
-        if "vlan-parent" in template_stem:
-            parent_ifaces = {vlan.parent for vlan in node.vlans}
-            for iface in node.interfaces:
-                if iface.name in parent_ifaces:
-                    yield Path(output_path_str.replace("{iface}", iface.name)), {**context, "iface": iface}
+        if template_stem == "vlan-parent.network":
+            for iface in ifaces.vlan_parents:
+                context["iface"] = iface
+                yield directory / name.format(iface=iface.name), context
 
-        elif "bridge-port" in template_stem:
+        elif template_stem == "bridge-port.network":
             for iface in node.interfaces:
                 if iface.bridge_name is not None:
-                    yield Path(output_path_str.replace("{iface}", iface.name)), {**context, "iface": iface}
+                    context["iface"] = iface
+                    yield directory / name.format(iface=iface.name), context
             for vlan in node.vlans:
                 if vlan.bridge_name is not None:
-                    yield Path(output_path_str.replace("{iface}", vlan.name)), {**context, "iface": vlan}
+                    context["iface"] = vlan
+                    yield directory / name.format(iface=vlan.name), context
+
+        elif template_stem == "interface.link":
+            for iface in ifaces.link:
+                # Higher VBox slot → lower file priority number → processed first by udev.
+                # This unwinds rename chains from the tail so that, e.g., eth2→eth3 fires
+                # before eth1→eth2 fires before eth0→eth1, avoiding name-in-use conflicts.
+                slot = iface.vbox_nic_index if iface.vbox_nic_index is not None else 1
+                priority = 46 - slot  # slot 1→45, slot 2→44, …, slot 36→10
+                context["iface"] = iface
+                yield directory / f"{priority:02d}-{iface.name}.link", context
 
         else:
-            vlan_parents = {vlan.parent for vlan in node.vlans}
-            for iface in node.interfaces:
-                if not iface.configured:
-                    continue
-                # Skip .link generation for loopbacks or interfaces without a MAC
-                is_link_template = template_stem == "interface.link"
-                if is_link_template and (iface.kind == InterfaceKind.LOOPBACK or not iface.mac_address):
-                    continue
-                # Bridge-member interfaces are fully configured by bridge-port.network; skip their .network file
-                # VLAN parent interfaces are fully configured by vlan-parent.network; skip their .network file
-                if not is_link_template and (iface.bridge_name is not None or iface.name in vlan_parents):
-                    continue
-                if is_link_template:
-                    # Higher VBox slot → lower file priority number → processed first by udev.
-                    # This unwinds rename chains from the tail so that, e.g., eth2→eth3 fires
-                    # before eth1→eth2 fires before eth0→eth1, avoiding name-in-use conflicts.
-                    slot = iface.vbox_nic_index if iface.vbox_nic_index is not None else 1
-                    priority = 46 - slot  # slot 1→45, slot 2→44, …, slot 36→10
-                    yield (
-                        Path(output_path_str).parent / f"{priority:02d}-{iface.name}.link",
-                        {**context, "iface": iface},
-                    )
-                else:
-                    yield Path(output_path_str.replace("{iface}", iface.name)), {**context, "iface": iface}
-
-    def _get_output_path(self, template_stem: str, node: "InternalNode", outdir: Path) -> Path | None:
-        """Map template stem to output file path."""
+            for iface in ifaces.network:
+                context["iface"] = iface
+                yield directory / name.format(iface=iface.name), context
+
+    def _get_output_path(self, template_stem: str) -> str | None:
+        """Map template stem to output file path, relative to the node's outdir."""
 
         relative = self._OUTPUT_PATHS.get(template_stem)
         if relative is None:
-            self.console.print(f"[yellow]Warning: no output path mapping for template '{template_stem}'[/yellow]")
-            return None
-        return outdir / relative
+            self.app.warn(f"Warning: no output path mapping for template '{template_stem}'")
+        return relative
 
     def _generate_services_list(
         self,
         env: Environment,
         node: "InternalNode",
         outdir: Path,
+        outputs: dict[Path, str],
     ) -> None:
-        """Generate services.list for the VM agent."""
+        """Generate services.list for the VM agent into *outputs*."""
 
         try:
             template = env.get_template("services/services.list.j2")
             content = template.render(node=node)
-            if content.strip():
-                (outdir / "services.list").write_text(content, encoding="utf-8", newline="\n")
+            if content and not content.isspace():
+                outputs[outdir / "services.list"] = content
         except TemplateNotFound:
             services = []
 
@@ -288,30 +509,37 @@ class ConfigController(BaseController["Application"]):
                 services.append("+ wg-quick@wg0")
 
             if services:
-                (outdir / "services.list").write_text("\n".join(services) + "\n", encoding="utf-8", newline="\n")
+                outputs[outdir / "services.list"] = "\n".join(services) + "\n"
 
     def _write_debug_json(self, node: "InternalNode", outdir: Path) -> None:
         """Write debug JSON with node info."""
 
-        (outdir / "_node.json").write_bytes(
-            orjson.dumps(
-                {
-                    "name": node.name,
-                    "role": node.role,
-                    "interfaces": [
-                        {
-                            "name": iface.name,
-                            "ip": iface.ip,
-                            "gateway": iface.gateway,
-                            "peer": iface.peer_node,
-                        }
-                        for iface in node.interfaces
-                    ],
-                },
-                option=orjson.OPT_INDENT_2,
-            ),
+        path = outdir / "_node.json"
+        data = orjson.dumps(
+            {
+                "name": node.name,
+                "role": node.role,
+                "interfaces": [
+                    {
+                        "name": iface.name,
+                        "ip": iface.ip,
+                        "gateway": iface.gateway,
+                        "peer": iface.peer_node,
+                    }
+                    for iface in node.interfaces
+                ],
+            },
+            option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
         )
 
+        # Leave an identical file untouched so its mtime only moves when the node changes
+        try:
+            if path.read_bytes() == data:
+                return
+        except FileNotFoundError:
+            pass
+        path.write_bytes(data)
+
     def attach(self, topo: "InternalTopology") -> None:
         """Copy generated configs into each node's config-drive."""
 
@@ -351,11 +579,6 @@ class ConfigController(BaseController["Application"]):
             saved = Path(node.saved_configs_dir)
             if not saved.exists():
                 continue
-            target = Path(node.config_dir)
-            target.mkdir(parents=True, exist_ok=True)
-            for p in saved.rglob("*"):
-                if p.is_file():
-                    rel = p.relative_to(saved)
-                    dst = target / rel
-                    dst.parent.mkdir(parents=True, exist_ok=True)
-                    dst.write_bytes(p.read_bytes())
+            # copyfile copies in the kernel (sendfile/fcopyfile) where supported. Hardlinks are avoided
+            # on purpose: regenerating configs would then rewrite the saved copies too
+            shutil.copytree(saved, node.config_dir, copy_function=shutil.copyfile, dirs_exist_ok=True)
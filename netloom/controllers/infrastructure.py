@@ -1,21 +1,72 @@
 """Infrastructure controller for VirtualBox VM lifecycle management."""
 
+import re
 import shutil
 import subprocess
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from ..core.controller import BaseController
 from ..core.enums import VMControlAction, VMState
-from ..core.vbox import VBoxManage
+from ..core.vbox import VBoxManage, parse_machinereadable
 from ..data import ConfigDrive, format_fat16
 
 
 if TYPE_CHECKING:
     from ..core.application import Application
     from ..core.vbox import UartConfig, VBoxSettings
-    from ..models.internal import InternalNode, InternalTopology
+    from ..models.internal import InternalNode, InternalTopology, InternalVBoxSettings
+
+_T = TypeVar("_T")
+
+# modifyvm options that are the same for every node: boot from disk only, no audio
+_FIXED_HW_ARGS = (
+    "--boot1",
+    "disk",
+    "--boot2",
+    "none",
+    "--boot3",
+    "none",
+    "--boot4",
+    "none",
+    "--audio-enabled",
+    "off",
+    "--audio-in",
+    "off",
+    "--audio-out",
+    "off",
+    "--audio-driver",
+    "none",
+)
+
+
+def _platform_args(vbox: "InternalVBoxSettings") -> list[str]:
+    """modifyvm options for a topology's chipset, APIC, HPET and paravirtualization settings."""
+
+    return [
+        "--chipset",
+        vbox.chipset,
+        "--ioapic",
+        "on" if vbox.ioapic else "off",
+        "--hpet",
+        "on" if vbox.hpet else "off",
+        "--paravirtprovider",
+        vbox.paravirt_provider,
+    ]
+
+
+# One disk entry of ``VBoxManage list hdds``: its UUID, optional parent UUID and location
+_HDD_RE = re.compile(
+    r"^UUID:[ \t]*(\S+)[ \t]*\r?\n"
+    r"(?:Parent UUID:[ \t]*(\S+)[ \t]*\r?\n|(?!UUID:).*\r?\n)*?"
+    r"Location:[ \t]*(.+?)[ \t]*\r?$",
+    re.MULTILINE,
+)
 
 
 @dataclass(frozen=True, slots=True)
@@ -33,6 +84,10 @@ class InfrastructureController(BaseController["Application"]):
     def __init__(self, app: "Application") -> None:
         super().__init__(app)
         self._vbox = VBoxManage()
+        self._queries: dict[tuple[str, str], Any] | None = None
+        """Query results reused within one operation (see ``_cached_queries``); ``None`` outside of one."""
+        self._base_ready = False
+        """Whether ``_ensure_base_imported`` already succeeded in this process."""
 
     @property
     def _s(self) -> "VBoxSettings":
@@ -50,25 +105,78 @@ class InfrastructureController(BaseController["Application"]):
 
         return self._vm_dir(node) / f"{node.name}-configdrive.vmdk"
 
+    def _for_each(self, fn: Callable[[_T], object], items: Iterable[_T], *, stagger: float = 0.0) -> None:
+        """Run *fn* for every item, up to ``jobs`` at a time; re-raise the first failure as it happens.
+
+        With *stagger*, parallel items are submitted at least that many seconds apart.
+        """
+
+        items = list(items)
+        workers = min(self._s.jobs, len(items))
+        if workers <= 1:
+            for item in items:
+                fn(item)
+            return
+
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = []
+            for item in items:
+                if futures and stagger:
+                    time.sleep(stagger)
+                futures.append(pool.submit(fn, item))
+            for future in as_completed(futures):
+                future.result()
+        finally:
+            # On failure, drop items that have not started yet instead of running them to completion
+            pool.shutdown(cancel_futures=True)
+
+    @contextmanager
+    def _cached_queries(self) -> Iterator[None]:
+        """Reuse ``list vms`` / ``showvminfo`` output for the duration of one operation."""
+
+        self._queries = {}
+        try:
+            yield
+        finally:
+            self._queries = None
+
+    def _cached(self, key: tuple[str, str], fetch: Callable[[], _T]) -> _T:
+        """Return the cached result for *key* within an operation, otherwise call *fetch*."""
+
+        if self._queries is None:
+            return fetch()
+        if key not in self._queries:
+            self._queries[key] = fetch()
+        return self._queries[key]
+
+    def _forget(self, *keys: tuple[str, str]) -> None:
+        """Drop cached query results invalidated by a VBoxManage command that changed them."""
+
+        if self._queries is not None:
+            for key in keys:
+                self._queries.pop(key, None)
+
+    def _list_vms(self) -> dict[str, str]:
+        return self._cached(("vms", ""), self._vbox.list_vms)
+
+    def _show_vm_info(self, vm_name: str) -> dict[str, str]:
+        """Parsed ``showvminfo`` of a VM; empty if the VM does not exist."""
+
+        return self._cached(("info", vm_name), lambda: parse_machinereadable(self._vbox.show_vm_info(vm_name)))
+
     def _has_snapshot(self, vm_name: str, snapshot_name: str) -> bool:
         return snapshot_name in self._vbox.list_snapshots(vm_name)
 
     def get_vm_state(self, vm_name: str) -> str | None:
         """Return VMState (e.g. `running`, `poweroff`) or None if VM does not exist."""
 
-        info = self._vbox.show_vm_info(vm_name)
-        if not info:
-            return None
-        for line in info.splitlines():
-            if line.startswith("VMState="):
-                return line.split("=", 1)[1].strip('"')
-
-        return None
+        return self._show_vm_info(vm_name).get("VMState")
 
     def get_connection_endpoint(self, vm_name: str) -> tuple[str, int] | None:
         """Get URI for connecting to VM's UART1 or None if not reachable."""
 
-        cfg = self._vbox.get_uart_config(vm_name)
+        cfg = self._vbox.get_uart_config(vm_name, self._show_vm_info(vm_name))
         if not cfg.enabled or cfg.mode != "tcpserver" or not cfg.endpoint.isdigit():
             return None
 
@@ -78,47 +186,29 @@ class InfrastructureController(BaseController["Application"]):
         """Collect live status for every node in the topology."""
 
         result: list[NodeStatus] = []
-        for node in topo.nodes:
-            if node_name and node.name != node_name:
-                continue
-            state = self.get_vm_state(node.name)
-            endpoint = self.get_connection_endpoint(node.name) if state == VMState.RUNNING else None
-            port = endpoint[1] if endpoint else None
-            result.append(NodeStatus(name=node.name, state=state, port=port))
+        with self._cached_queries():
+            for node in topo.nodes:
+                if node_name and node.name != node_name:
+                    continue
+                state = self.get_vm_state(node.name)
+                endpoint = self.get_connection_endpoint(node.name) if state == VMState.RUNNING else None
+                port = endpoint[1] if endpoint else None
+                result.append(NodeStatus(name=node.name, state=state, port=port))
 
         return result
 
     def _cleanup_orphaned_base_media(self) -> None:
         """Remove any orphaned disk media from a previous failed import."""
 
-        output = self._vbox.list_hdds()
-
-        disks_info: dict[str, dict[str, str]] = {}
-        current_uuid = None
-        current_parent = None
-        current_location = None
-
-        for line in output.splitlines():
-            line = line.strip()
-            if line.startswith("UUID:"):
-                current_uuid = line.split(":", 1)[1].strip()
-            elif line.startswith("Parent UUID:"):
-                current_parent = line.split(":", 1)[1].strip()
-            elif line.startswith("Location:"):
-                current_location = line.split(":", 1)[1].strip()
-                if current_uuid and current_location:
-                    disks_info[current_uuid] = {
-                        "parent": current_parent or "base",
-                        "location": current_location,
-                    }
-                current_uuid = None
-                current_parent = None
-                current_location = None
+        basefolder_lower = str(self._s.basefolder).lower()
+        base_lower = self._s.base_vm_name.lower()
 
+        children: dict[str, list[str]] = {}
         orphaned_roots = set()
-        for uuid, info in disks_info.items():
-            loc_lower = info["location"].lower()
-            if str(self._s.basefolder).lower() in loc_lower and self._s.base_vm_name.lower() in loc_lower:
+        for uuid, parent, location in _HDD_RE.findall(self._vbox.list_hdds()):
+            children.setdefault(parent or "base", []).append(uuid)
+            location = location.lower()
+            if basefolder_lower in location and base_lower in location:
                 orphaned_roots.add(uuid)
 
         def get_descendants(uuids: set[str]) -> list[str]:
@@ -127,9 +217,7 @@ class InfrastructureController(BaseController["Application"]):
             while queue:
                 current = queue.pop(0)
                 descendants.append(current)
-                for child_uuid, child_info in disks_info.items():
-                    if child_info["parent"] == current:
-                        queue.append(child_uuid)
+                queue.extend(children.get(current, ()))
             return descendants
 
         to_delete = []
@@ -140,7 +228,7 @@ class InfrastructureController(BaseController["Application"]):
                     to_delete.append(item)
 
         for disk_uuid in to_delete:
-            self.console.print(f"[yellow]Cleaning up orphaned disk: {disk_uuid}[/yellow]")
+            self.app.warn(f"Cleaning up orphaned disk: {disk_uuid}")
             try:
                 self._vbox.close_medium(disk_uuid, delete=True)
             except subprocess.CalledProcessError:
@@ -149,18 +237,22 @@ class InfrastructureController(BaseController["Application"]):
                 except subprocess.CalledProcessError:
                     self.console.print(f"[dim]Could not cleanup disk {disk_uuid}, continuing...[/dim]")
 
-        if self._s.basefolder.exists():
-            for folder in self._s.basefolder.rglob(self._s.base_vm_name):
-                if folder.is_dir():
-                    self.console.print(f"[yellow]Removing leftover folder: {folder}[/yellow]")
-                    shutil.rmtree(folder, ignore_errors=True)
+        # OVA import always creates the base VM directly under basefolder
+        folder = self._s.basefolder / self._s.base_vm_name
+        if folder.is_dir():
+            self.app.warn(f"Removing leftover folder: {folder}")
+            shutil.rmtree(folder, ignore_errors=True)
 
     def _ensure_base_imported(self, topo: "InternalTopology") -> None:
         """Ensure the base VM is imported from OVA and has a snapshot."""
 
-        if self._s.base_vm_name in self._vbox.list_vms():
+        if self._base_ready:
+            return
+
+        if self._s.base_vm_name in self._list_vms():
             if not self._has_snapshot(self._s.base_vm_name, self._s.snapshot_name):
                 self._vbox.take_snapshot(self._s.base_vm_name, self._s.snapshot_name)
+            self._base_ready = True
             return
 
         if not self._s.ova_path:
@@ -170,31 +262,24 @@ class InfrastructureController(BaseController["Application"]):
         self._s.basefolder.mkdir(parents=True, exist_ok=True)
 
         self._vbox.import_ova(self._s.ova_path, self._s.base_vm_name, self._s.basefolder)
+        self._forget(("vms", ""))
 
-        vbox = topo.vbox
-        self._vbox.modify_vm(
-            self._s.base_vm_name,
-            "--chipset",
-            vbox.chipset,
-            "--ioapic",
-            "on" if vbox.ioapic else "off",
-            "--hpet",
-            "on" if vbox.hpet else "off",
-            "--paravirtprovider",
-            vbox.paravirt_provider,
-        )
+        self._vbox.modify_vm(self._s.base_vm_name, *_platform_args(topo.vbox))
+        self._forget(("info", self._s.base_vm_name))
 
         if not self._has_snapshot(self._s.base_vm_name, self._s.snapshot_name):
             self._vbox.take_snapshot(self._s.base_vm_name, self._s.snapshot_name)
+        self._base_ready = True
 
     def _ensure_sata_storage_controller(self, vm_name: str) -> None:
         """Ensure the VM has a SATA storage controller."""
 
-        info = self._vbox.show_vm_info(vm_name)
-        if f'storagecontrollername0="{self._s.controller_name.lower()}"' in info.lower():
+        controller = self._show_vm_info(vm_name).get("storagecontrollername0", "")
+        if controller.lower() == self._s.controller_name.lower():
             return
 
         self._vbox.storage_ctl(vm_name, self._s.controller_name, add="sata", controller="IntelAhci")
+        self._forget(("info", vm_name))
 
     def _modify_vm_hw(self, node: "InternalNode", topo: "InternalTopology", uart: "UartConfig", node_idx: int) -> None:
         """Configure VM hardware (RAM, CPU, chipset, boot order)."""
@@ -225,49 +310,33 @@ class InfrastructureController(BaseController["Application"]):
             str(node.resources.ram_mb),
             "--cpus",
             str(node.resources.cpu),
-            "--chipset",
-            vbox.chipset,
-            "--ioapic",
-            "on" if vbox.ioapic else "off",
-            "--hpet",
-            "on" if vbox.hpet else "off",
-            "--paravirtprovider",
-            vbox.paravirt_provider,
+            *_platform_args(vbox),
             *uart_args,
-            "--boot1",
-            "disk",
-            "--boot2",
-            "none",
-            "--boot3",
-            "none",
-            "--boot4",
-            "none",
-            "--audio-enabled",
-            "off",
-            "--audio-in",
-            "off",
-            "--audio-out",
-            "off",
-            "--audio-driver",
-            "none",
+            *_FIXED_HW_ARGS,
         )
-
-    def _wire_nics(self, node: "InternalNode") -> None:
-        """Wire network interfaces to VirtualBox internal networks."""
-
-        for i in range(1, 37):
-            self._vbox.modify_vm(node.name, f"--nic{i}", "none")
-
-        for iface in node.interfaces:
-            if iface.vbox_nic_index is None:
-                continue
-
+        self._forget(("info", node.name))
+
+    def _wire_nics(self, node: "InternalNode", info: dict[str, str]) -> None:
+        """Wire network interfaces to VirtualBox internal networks (*info*: the VM's current showvminfo)."""
+
+        # modifyvm accepts any number of options, so every slot is set in a single invocation;
+        # unused slots are only reset when the VM does not already report them as "none"
+        wired = [iface for iface in node.interfaces if iface.vbox_nic_index is not None]
+        used = {iface.vbox_nic_index for iface in wired}
+        args = [
+            arg
+            for i in range(1, 37)
+            if i not in used and info.get(f"nic{i}") != "none"
+            for arg in (f"--nic{i}", "none")
+        ]
+        nic_type = node.nic_model.vbox_type
+
+        for iface in wired:
             idx = iface.vbox_nic_index
-            nic_type = node.nic_model.vbox_type
             mac_address = iface.mac_address.replace(":", "") if iface.mac_address else None
 
             if iface.nat:
-                args = [
+                args += [
                     f"--nic{idx}",
                     "nat",
                     f"--nictype{idx}",
@@ -279,7 +348,7 @@ class InfrastructureController(BaseController["Application"]):
                     args.extend([f"--macaddress{idx}", mac_address])
 
             elif iface.network is not None:
-                args = [
+                args += [
                     f"--nic{idx}",
                     "intnet",
                     f"--intnet{idx}",
@@ -296,7 +365,7 @@ class InfrastructureController(BaseController["Application"]):
 
             else:
                 # Null mode: NIC hardware present in guest but no internet connectivity.
-                args = [
+                args += [
                     f"--nic{idx}",
                     "null",
                     f"--nictype{idx}",
@@ -307,7 +376,9 @@ class InfrastructureController(BaseController["Application"]):
                 if mac_address:
                     args.extend([f"--macaddress{idx}", mac_address])
 
+        if args:
             self._vbox.modify_vm(node.name, *args)
+            self._forget(("info", node.name))
 
     def init(self, topo: "InternalTopology", workdir: str | Path) -> None:
         """Initialize: import base OVA and create workdir structure."""
@@ -320,13 +391,35 @@ class InfrastructureController(BaseController["Application"]):
     def create(self, topo: "InternalTopology") -> None:
         """Create linked clones and attach config-drives."""
 
-        self._ensure_base_imported(topo)
-        existing_vms = self._vbox.list_vms()
-        uart = self._vbox.get_uart_config(self._s.base_vm_name)
+        with self._cached_queries():
+            self._ensure_base_imported(topo)
+            existing_vms = self._list_vms()
+            uart = self._vbox.get_uart_config(self._s.base_vm_name, self._show_vm_info(self._s.base_vm_name))
 
-        for node_idx, node in enumerate(topo.nodes, start=1):
-            vm_dir = self._vm_dir(node)
-            vm_dir.mkdir(parents=True, exist_ok=True)
+            def create_one(indexed: tuple[int, "InternalNode"]) -> None:
+                node_idx, node = indexed
+                self._create_vm(node, topo, uart, node_idx, existing_vms)
+
+            self._for_each(create_one, enumerate(topo.nodes, start=1))
+
+    def _create_vm(
+        self,
+        node: "InternalNode",
+        topo: "InternalTopology",
+        uart: "UartConfig",
+        node_idx: int,
+        existing_vms: dict[str, str],
+    ) -> None:
+        """Clone, configure and attach the config-drive for a single node."""
+
+        vm_dir = self._vm_dir(node)
+        vm_dir.mkdir(parents=True, exist_ok=True)
+
+        # The config-drive does not depend on the VM, so it is built while the VM is cloned and
+        # configured; only the final storageattach needs both
+        cfg_vmdk = self._cfg_vmdk(node)
+        with ThreadPoolExecutor(max_workers=1) as side:
+            cfg_ready = side.submit(self._prepare_configdrive, cfg_vmdk)
 
             if node.name not in existing_vms:
                 self._vbox.clone_vm(
@@ -335,54 +428,68 @@ class InfrastructureController(BaseController["Application"]):
                     name=node.name,
                     basefolder=self._s.basefolder,
                 )
+                self._forget(("vms", ""))
 
+            # Everything that reads showvminfo runs before modifyvm, so a single query serves them all
+            info = self._show_vm_info(node.name)
+            self._ensure_sata_storage_controller(node.name)
             self._modify_vm_hw(node, topo, uart, node_idx)
-            self._wire_nics(node)
+            self._wire_nics(node, info)
 
-            cfg_vmdk = self._cfg_vmdk(node)
-            if not cfg_vmdk.exists():
-                try:
-                    self._vbox.close_medium(cfg_vmdk.as_posix())
-                except subprocess.CalledProcessError:
-                    pass
-                self._create_configdrive(cfg_vmdk)
+            cfg_ready.result()
 
-            # attach at SATA port 1 (port 0 is the OS disk from the clone)
-            self._ensure_sata_storage_controller(node.name)
-            self._vbox.storage_attach(
-                node.name,
-                storagectl=self._s.controller_name,
-                port=1,
-                device=0,
-                medium_type="hdd",
-                medium=cfg_vmdk.as_posix(),
-            )
+        # attach at SATA port 1 (port 0 is the OS disk from the clone)
+        self._vbox.storage_attach(
+            node.name,
+            storagectl=self._s.controller_name,
+            port=1,
+            device=0,
+            medium_type="hdd",
+            medium=cfg_vmdk.as_posix(),
+        )
+
+    def _prepare_configdrive(self, cfg_vmdk: Path) -> None:
+        """Create the config-drive unless it already exists, dropping any stale registration first."""
+
+        if cfg_vmdk.exists():
+            return
+        try:
+            self._vbox.close_medium(cfg_vmdk.as_posix())
+        except subprocess.CalledProcessError:
+            pass
+        self._create_configdrive(cfg_vmdk)
 
     def start(self, topo: "InternalTopology") -> None:
         """Start all VMs in the topology."""
 
-        for node in topo.nodes:
-            self._vbox.start_vm(node.name)
+        # Boots are spread out so VBoxSVC and the host disks do not take every VM's startup at once
+        self._for_each(self._vbox.start_vm, [node.name for node in topo.nodes], stagger=self._s.start_stagger)
 
     def stop(self, topo: "InternalTopology") -> None:
         """Send stop signals to all VMs."""
 
-        for node in topo.nodes:
-            state = self.get_vm_state(node.name)
+        with self._cached_queries():
+            self._for_each(self._stop_vm, [node.name for node in topo.nodes])
 
-            if state is None:
-                self.console.print(f"[yellow]VM '{node.name}' not found, skipping.[/yellow]")
-                continue
+    def _stop_vm(self, vm_name: str) -> None:
+        """Send ACPI power button to a single running VM."""
 
-            if state != VMState.RUNNING:
-                self.console.print(f"[yellow]VM '{node.name}' is not running (state: {state}), skipping.[/yellow]")
-                continue
+        state = self.get_vm_state(vm_name)
 
-            try:
-                self._vbox.control_vm(node.name, VMControlAction.ACPI_POWER_BUTTON)
-                self.console.print(f"[green]Sent ACPI power button to '{node.name}'[/green]")
-            except subprocess.CalledProcessError as e:
-                self.console.print(f"[red]Failed to stop '{node.name}': {e}[/red]")
+        if state is None:
+            self.app.warn(f"VM '{vm_name}' not found, skipping.")
+            return
+
+        if state != VMState.RUNNING:
+            self.app.warn(f"VM '{vm_name}' is not running (state: {state}), skipping.")
+            return
+
+        try:
+            self._vbox.control_vm(vm_name, VMControlAction.ACPI_POWER_BUTTON)
+            self._forget(("info", vm_name))
+            self.app.ok(f"Sent ACPI power button to '{vm_name}'")
+        except subprocess.CalledProcessError as e:
+            self.app.error(f"Failed to stop '{vm_name}': {e}")
 
     def _destroy_vm(self, vm_name: str) -> bool:
         """Stop and remove a single VM. Returns True on success."""
@@ -390,34 +497,37 @@ class InfrastructureController(BaseController["Application"]):
         state = self.get_vm_state(vm_name)
 
         if state is None:
-            self.console.print(f"[yellow]VM '{vm_name}' not found, skipping.[/yellow]")
+            self.app.warn(f"VM '{vm_name}' not found, skipping.")
             return False
 
         if state == VMState.RUNNING:
             self.console.print(f"[dim]Powering off '{vm_name}'...[/dim]")
             try:
                 self._vbox.control_vm(vm_name, VMControlAction.POWEROFF)
+                self._forget(("info", vm_name))
             except subprocess.CalledProcessError as e:
-                self.console.print(f"[red]Failed to power off '{vm_name}': {e}[/red]")
+                self.app.error(f"Failed to power off '{vm_name}': {e}")
                 return False
 
         try:
             self._vbox.unregister_vm(vm_name, delete=True)
-            self.console.print(f"[green]Destroyed VM '{vm_name}'[/green]")
+            self._forget(("vms", ""), ("info", vm_name))
+            self.app.ok(f"Destroyed VM '{vm_name}'")
             return True
         except subprocess.CalledProcessError as e:
-            self.console.print(f"[red]Failed to destroy '{vm_name}': {e}[/red]")
+            self.app.error(f"Failed to destroy '{vm_name}': {e}")
             return False
 
     def destroy(self, topo: "InternalTopology", *, destroy_base: bool = False) -> None:
         """Stop and remove all VMs in the topology."""
 
-        for node in topo.nodes:
-            self._destroy_vm(node.name)
+        with self._cached_queries():
+            self._for_each(self._destroy_vm, [node.name for node in topo.nodes])
 
-        if destroy_base:
-            self.console.print(f"[dim]Destroying base VM '{self._s.base_vm_name}'...[/dim]")
-            self._destroy_vm(self._s.base_vm_name)
+            if destroy_base:
+                self.console.print(f"[dim]Destroying base VM '{self._s.base_vm_name}'...[/dim]")
+                self._destroy_vm(self._s.base_vm_name)
+                self._base_ready = False
 
     def get_configdrive(self, node: "InternalNode") -> ConfigDrive:
         """Return the ConfigDrive handle for a node."""
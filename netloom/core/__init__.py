@@ -1,7 +1,9 @@
 """NetLoom core framework."""
 
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .application import Application
-from .controller import BaseController
 from .enums import (
     FirewallAction,
     FirewallImpl,
@@ -18,11 +20,29 @@ from .enums import (
     VMState,
 )
 from .errors import ConfigurationError, InfrastructureError, NetLoomError, TopologyError
-from .model import DisplayModel
-from .types import AppT
 from .vbox import VBoxManage, VBoxSettings
 
 
+if TYPE_CHECKING:
+    from .controller import BaseController
+    from .model import DisplayModel
+    from .types import AppT
+
+# These modules import pydantic; resolve them on first access (PEP 562) so the CLI starts without it
+_LAZY_IMPORTS: dict[str, str] = {
+    "AppT": ".types",
+    "BaseController": ".controller",
+    "DisplayModel": ".model",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
+
+
 __all__ = [
     "AppT",
     "Application",
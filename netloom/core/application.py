@@ -1,34 +1,46 @@
 """Application singleton with dependency injection for controllers."""
 
+import threading
 from functools import cached_property
 from pathlib import Path
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 
 from rich.console import Console
+from rich.text import Text
 
-from ..controllers.config import ConfigController
-from ..controllers.infrastructure import InfrastructureController
 from .vbox import VBoxSettings
 
 
+if TYPE_CHECKING:
+    from ..controllers.config import ConfigController
+    from ..controllers.infrastructure import InfrastructureController
+
+
 class Application:
     """Main application."""
 
     _instance: ClassVar["Application | None"] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self) -> None:
         self._console = Console()
         self._workdir: Path = Path()
         self._debug: bool = True
+        self._template_cache: bool = True
         self.vbox_settings: VBoxSettings = VBoxSettings()
 
     @classmethod
     def current(cls) -> "Application":
         """Get current application instance."""
 
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        # Double-checked: once created, the instance is returned without taking the lock
+        instance = cls._instance
+        if instance is None:
+            with cls._instance_lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = cls._instance = cls()
+        return instance
 
     @classmethod
     def reset(cls) -> None:
@@ -41,6 +53,21 @@ class Application:
         """Rich console for user-facing output."""
         return self._console
 
+    def ok(self, message: str) -> None:
+        """Print a success message as plain styled text, skipping markup parsing and highlighting."""
+
+        self._console.print(Text(message, style="green"))
+
+    def warn(self, message: str) -> None:
+        """Print a warning message as plain styled text."""
+
+        self._console.print(Text(message, style="yellow"))
+
+    def error(self, message: str) -> None:
+        """Print an error message as plain styled text."""
+
+        self._console.print(Text(message, style="red"))
+
     @property
     def workdir(self) -> Path:
         return self._workdir
@@ -57,14 +84,27 @@ class Application:
     def debug(self, value: bool) -> None:
         self._debug = value
 
+    @property
+    def template_cache(self) -> bool:
+        """Whether compiled templates are cached on disk between runs."""
+        return self._template_cache
+
+    @template_cache.setter
+    def template_cache(self, value: bool) -> None:
+        self._template_cache = value
+
     @cached_property
-    def infrastructure(self) -> InfrastructureController:
+    def infrastructure(self) -> "InfrastructureController":
         """Infrastructure controller."""
 
+        from ..controllers.infrastructure import InfrastructureController
+
         return InfrastructureController(self)
 
     @cached_property
-    def config(self) -> ConfigController:
+    def config(self) -> "ConfigController":
         """Config controller."""
 
+        from ..controllers.config import ConfigController
+
         return ConfigController(self)
@@ -43,11 +43,14 @@ class NicModel(StrEnum):
     def vbox_type(self) -> str:
         """Return the VirtualBox NIC adapter type string for this model."""
 
-        return {
-            NicModel.VIRTIO: "virtio",
-            NicModel.E1000: "82540EM",
-            NicModel.RTL8139: "Am79C973",
-        }[self]
+        return _NIC_VBOX_TYPES[self]
+
+
+_NIC_VBOX_TYPES: dict[NicModel, str] = {
+    NicModel.VIRTIO: "virtio",
+    NicModel.E1000: "82540EM",
+    NicModel.RTL8139: "Am79C973",
+}
 
 
 class VBoxChipset(StrEnum):
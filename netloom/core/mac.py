@@ -15,12 +15,12 @@ def generate_mac(seed: str | None = None, random_mac: bool = False) -> str:
     """Generate a MAC address."""
 
     if random_mac or seed is None:
-        mac_bytes = bytearray(random.getrandbits(8) for _ in range(6))
+        mac_bytes = bytearray(random.randbytes(6))  # noqa: S311
     else:
         # Deterministic generation using MD5 of the seed
-        hash_bytes = hashlib.md5(seed.encode("utf-8")).digest()  # noqa: S324
+        hash_bytes = hashlib.md5(seed.encode("utf-8"), usedforsecurity=False).digest()
         mac_bytes = bytearray(hash_bytes[:6])
 
     _set_locally_administered(mac_bytes)
 
-    return ":".join(f"{b:02x}" for b in mac_bytes).upper()
+    return mac_bytes.hex(":").upper()
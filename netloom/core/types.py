@@ -10,16 +10,19 @@ if TYPE_CHECKING:
 
 AppT = TypeVar("AppT", bound="Application")
 
+# Dotted-quad IPv4 address, shared by the address, CIDR and router ID patterns
+_DOTTED_QUAD = r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}"
+
 NameID = Annotated[str, StringConstraints(pattern=r"^[a-zA-Z0-9_-]+$")]
 """Safe identifier for use in filesystem paths: alphanumeric, underscores, and dashes only."""
 
-CIDRStr = Annotated[str, StringConstraints(pattern=r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}/\d{1,2}$")]
+CIDRStr = Annotated[str, StringConstraints(pattern=rf"^{_DOTTED_QUAD}/\d{{1,2}}$")]
 """IPv4 CIDR notation (e.g., 10.0.12.1/24)."""
 
-IPv4Str = Annotated[str, StringConstraints(pattern=r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")]
+IPv4Str = Annotated[str, StringConstraints(pattern=rf"^{_DOTTED_QUAD}$")]
 """IPv4 address without prefix."""
 
-RouterIdStr = Annotated[str, StringConstraints(pattern=r"^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}$")]
+RouterIdStr = IPv4Str
 """Router ID in dotted-quad format."""
 
 PortNum = Annotated[int, Field(ge=1, le=65535)]
@@ -1,13 +1,37 @@
 """VirtualBox adapter: VBoxManage CLI wrapper and VBoxSettings dataclass."""
 
 import re
+import shutil
 import subprocess
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 from .enums import VMStartType
 
 
+# One ``"name" {uuid}`` entry of ``VBoxManage list vms``; the name itself may contain quotes
+_VM_LINE_RE = re.compile(r'^"(.*)"\s+\{([0-9a-fA-F-]+)\}\s*$', re.MULTILINE)
+
+
+@cache
+def _vboxmanage_executable() -> str:
+    """Absolute path of VBoxManage; subprocess only launches via posix_spawn (not fork) given a full path."""
+
+    return shutil.which("VBoxManage") or "VBoxManage"
+
+
+def parse_machinereadable(text: str) -> dict[str, str]:
+    """Parse ``showvminfo --machinereadable`` output into ``{key: value}`` with quotes stripped."""
+
+    info: dict[str, str] = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            info[key.strip('"')] = value.strip('"')
+    return info
+
+
 @dataclass
 class UartConfig:
     """Parsed UART configuration from VBoxManage showvminfo output."""
@@ -29,6 +53,8 @@ class VBoxSettings:
     snapshot_name: str = "golden"
     configdrive_mb: int = 128
     controller_name: str = "Disks"
+    jobs: int = 4
+    start_stagger: float = 0.2
 
 
 class VBoxManage:
@@ -37,16 +63,18 @@ class VBoxManage:
     def _run(self, cmd: list[str]) -> None:
         """Run VBoxManage command, capturing output and raising on non-zero exit."""
 
-        subprocess.run(cmd, check=True, capture_output=True, timeout=60)  # noqa: S603
+        subprocess.run(cmd, executable=_vboxmanage_executable(), check=True, capture_output=True, timeout=60)  # noqa: S603
 
     def _query(self, cmd: list[str]) -> str:
         """Run VBoxManage command and return its stdout as text."""
 
         return subprocess.run(  # noqa: S603
             cmd,
+            executable=_vboxmanage_executable(),
             check=True,
             capture_output=True,
-            text=True,
+            encoding="utf-8",
+            errors="replace",
             timeout=60,
         ).stdout
 
@@ -55,8 +83,11 @@ class VBoxManage:
 
         return subprocess.run(  # noqa: S603
             cmd,
-            capture_output=True,
-            text=True,
+            executable=_vboxmanage_executable(),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
             timeout=60,
         ).stdout
 
@@ -64,15 +95,7 @@ class VBoxManage:
         """Return {name: uuid} for all registered VMs."""
 
         out = self._query(["VBoxManage", "list", "vms"])
-        result: dict[str, str] = {}
-        for line in out.strip().splitlines():
-            if not line.strip():
-                continue
-            name, rest = line.split('"', 2)[1], line.split('"', 2)[2]
-            uuid = rest.strip().strip("{}").strip()
-            result[name] = uuid
-
-        return result
+        return {m.group(1): m.group(2) for m in _VM_LINE_RE.finditer(out)}
 
     def list_hdds(self) -> str:
         """Return raw stdout of ``VBoxManage list hdds``."""
@@ -84,17 +107,18 @@ class VBoxManage:
 
         return self._probe(["VBoxManage", "showvminfo", vm_name, "--machinereadable"])
 
-    def get_uart_config(self, vm_name: str) -> UartConfig:
-        """Parse UART1 configuration from a VM's showvminfo output."""
+    def get_uart_config(self, vm_name: str, info: dict[str, str] | None = None) -> UartConfig:
+        """Parse UART1 configuration from a VM's showvminfo output (*info*, if already parsed)."""
 
-        info = self.show_vm_info(vm_name)
-        uart_match = re.search(r'^uart1="(.+?)"', info, re.MULTILINE)
-        mode_match = re.search(r'^uartmode1="(.+?)"', info, re.MULTILINE)
+        if info is None:
+            info = parse_machinereadable(self.show_vm_info(vm_name))
+        uart = info.get("uart1")
+        uart_mode = info.get("uartmode1")
 
-        if not uart_match or uart_match.group(1) == "off":
+        if not uart or uart == "off":
             return UartConfig(enabled=False)
 
-        uart_params = uart_match.group(1).split(",")
+        uart_params = uart.split(",")
         if len(uart_params) != 2:
             return UartConfig(enabled=False)
         io_base, irq_str = uart_params
@@ -104,10 +128,10 @@ class VBoxManage:
         except ValueError:
             return UartConfig(enabled=False)
 
-        if not mode_match:
+        if not uart_mode:
             return UartConfig(enabled=True, io_base=io_base, irq=irq)
 
-        mode_parts = mode_match.group(1).split(",", 1)
+        mode_parts = uart_mode.split(",", 1)
         mode = mode_parts[0]
         endpoint = mode_parts[1] if len(mode_parts) > 1 else ""
 
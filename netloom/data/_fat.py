@@ -1,21 +1,23 @@
 """Low-level FAT filesystem helpers for config-drive I/O."""
 
-from collections.abc import Generator
-from contextlib import contextmanager
+import os
+import shutil
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager, suppress
 from pathlib import Path
 from typing import Any
 
 from FATtools import FAT, mkfat
 from FATtools.disk import disk
 
-from .constants import BOOT_SECTOR_SIZE, FAT_BITS, MB
+from .constants import BOOT_SECTOR_SIZE, COPY_BUFFER_SIZE, FAT_BITS, MB
 
 
 @contextmanager
 def open_fat_fs(flat_path: Path, mode: str = "r+b") -> Generator[Any]:
     """Context manager that opens a FAT16 filesystem on a raw flat VMDK file."""
 
-    d = disk(str(flat_path), mode)
+    d = disk(os.fspath(flat_path), mode)
     fs = None
     try:
         d.seek(0)
@@ -47,18 +49,18 @@ def open_fat_fs(flat_path: Path, mode: str = "r+b") -> Generator[Any]:
 def format_fat16(flat_path: Path, size_mb: int) -> None:
     """Format raw flat VMDK file as FAT16."""
 
-    d = disk(str(flat_path), "r+b")
+    d = disk(os.fspath(flat_path), "r+b")
     try:
         mkfat.fat_mkfs(d, size_mb * MB, params={"fat_bits": FAT_BITS})
     finally:
         d.close()
 
 
-def makedirs(fs: Any, rel_path: Path) -> Any:
+def makedirs(fs: Any, parts: Iterable[str]) -> Any:
     """Create necessary directories in FAT filesystem and return the final directory."""
 
     current = fs
-    for part in rel_path.parts:
+    for part in parts:
         if not part:
             continue
         try:
@@ -71,37 +73,47 @@ def makedirs(fs: Any, rel_path: Path) -> Any:
 
 
 def copy_dir_recursive(cur_dir: Any, dst_dir: Path, copied: list[Path]) -> None:
-    """Recursively copy directory contents from FAT filesystem to local path."""
+    """Copy directory contents from FAT filesystem to local path.
 
-    try:
-        entries = list(cur_dir.iterator())
-    except Exception:
-        return
+    Walks with an explicit stack, so deep trees are not bounded by the recursion limit.
+    Each local directory is created once when it is reached, before any of its files.
+    """
 
-    for entry in entries:
-        name = entry.Name()
-        if name in (".", ".."):
+    stack: list[tuple[Any, Path]] = [(cur_dir, dst_dir)]
+    while stack:
+        fs_dir, local_dir = stack.pop()
+        try:
+            entries = list(fs_dir.iterator())
+        except Exception:  # noqa: S112
             continue
 
-        full_dst = dst_dir / name
-
-        if entry.IsDir():
-            full_dst.mkdir(parents=True, exist_ok=True)
-            try:
-                subdir = cur_dir.opendir(name)
-                copy_dir_recursive(subdir, full_dst, copied)
-            except Exception:  # noqa: S110
-                pass
-        else:
-            f = None
-            try:
-                f = cur_dir.open(name)
-                content = f.read()
-                full_dst.parent.mkdir(parents=True, exist_ok=True)
-                full_dst.write_bytes(content)
-                copied.append(full_dst)
-            except Exception:  # noqa: S110
-                pass
-            finally:
-                if f is not None:
-                    f.close()
+        for entry in entries:
+            name = entry.Name()
+            if name in (".", ".."):
+                continue
+
+            full_dst = local_dir / name
+
+            if entry.IsDir():
+                full_dst.mkdir(exist_ok=True)
+                try:
+                    stack.append((fs_dir.opendir(name), full_dst))
+                except Exception:  # noqa: S110
+                    pass
+            else:
+                f = None
+                # Streamed into a sibling file and swapped in only once complete,
+                # so a failed read leaves any previously saved copy intact
+                partial = local_dir / f".{name}.netloom-partial"
+                try:
+                    f = fs_dir.open(name)
+                    with partial.open("wb") as dst:
+                        shutil.copyfileobj(f, dst, COPY_BUFFER_SIZE)
+                    os.replace(partial, full_dst)
+                    copied.append(full_dst)
+                except Exception:
+                    with suppress(OSError):
+                        partial.unlink(missing_ok=True)
+                finally:
+                    if f is not None:
+                        f.close()
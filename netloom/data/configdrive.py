@@ -1,9 +1,32 @@
 """ConfigDrive dataclass and operations."""
 
+import os
+import shutil
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from ._fat import copy_dir_recursive, makedirs, open_fat_fs
+from .constants import COPY_BUFFER_SIZE
+
+
+def _iter_files(src_dir: str) -> Iterator[tuple[str, tuple[str, ...]]]:
+    """Yield ``(path, relative path parts)`` for every file under *src_dir*.
+
+    Walks with ``os.scandir`` so file/directory checks use the type returned by readdir
+    instead of a ``stat`` per entry. Symlinked directories are not descended into.
+    """
+
+    stack: list[tuple[str, tuple[str, ...]]] = [(src_dir, ())]
+    while stack:
+        directory, rel_parts = stack.pop()
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, (*rel_parts, entry.name)))
+                elif entry.is_file():
+                    yield entry.path, (*rel_parts, entry.name)
 
 
 @dataclass
@@ -21,18 +44,22 @@ class ConfigDrive:
         """Copy local directory tree into this config-drive."""
 
         src_dir = src_dir.resolve()
-        if not src_dir.exists() or not any(src_dir.iterdir()):
+        files = list(_iter_files(os.fspath(src_dir))) if src_dir.is_dir() else []
+        if not files:
             return
 
         with open_fat_fs(self.flat, "r+b") as fs:
-            for src_path in src_dir.rglob("*"):
-                if src_path.is_file():
-                    rel_path = src_path.relative_to(src_dir)
-                    parent_dir = makedirs(fs, rel_path.parent)
-                    content = src_path.read_bytes()
-                    f = parent_dir.create(rel_path.name)
+            # Opened FAT directory handles, so each directory is resolved once rather than per file
+            dirs: dict[tuple[str, ...], Any] = {(): fs}
+            for src_path, rel_parts in files:
+                parent_parts = rel_parts[:-1]
+                parent_dir = dirs.get(parent_parts)
+                if parent_dir is None:
+                    parent_dir = dirs[parent_parts] = makedirs(fs, parent_parts)
+                with open(src_path, "rb", buffering=0) as src:
+                    f = parent_dir.create(rel_parts[-1])
                     try:
-                        f.write(content)
+                        shutil.copyfileobj(src, f, COPY_BUFFER_SIZE)
                     finally:
                         f.close()
 
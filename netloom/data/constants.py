@@ -8,3 +8,6 @@ FAT_BITS = 16
 
 BOOT_SECTOR_SIZE = 512
 """Size of the boot sector in bytes."""
+
+COPY_BUFFER_SIZE = 64 * 1024
+"""Buffer size for streaming files in and out of a config-drive (FATtools updates the dir entry per write)."""
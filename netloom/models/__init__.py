@@ -7,57 +7,116 @@ This package contains:
 - config: User-facing topology configuration models (based on topology-schema.json)
 """
 
-from .common import (
-    load_topology,
-)
-from .config import (
-    BridgeConfig,
-    Defaults,
-    FirewallConfig,
-    FirewallRule,
-    InterfaceConfig,
-    Meta,
-    Network,
-    Node,
-    OSPFArea,
-    OSPFConfig,
-    RIPConfig,
-    RoutingConfig,
-    ServicesConfig,
-    StaticRoute,
-    Topology,
-    TunnelConfig,
-    VLANConfig,
-    WireguardConfig,
-    WireguardPeer,
-)
-from .converters import (
-    TopologyConverter,
-    convert_topology,
-)
-from .internal import (
-    InternalBridge,
-    InternalFirewall,
-    InternalFirewallRule,
-    InternalInterface,
-    InternalLink,
-    InternalNetwork,
-    InternalNode,
-    InternalOSPFArea,
-    InternalResources,
-    InternalRIP,
-    InternalRouting,
-    InternalServices,
-    InternalStaticRoute,
-    InternalSysctl,
-    InternalTopology,
-    InternalTunnel,
-    InternalVLAN,
-    InternalWireguard,
-    InternalWireguardPeer,
-    NicModel,
-    ifname_to_vbox_adapter_index,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from .common import (
+        load_topology,
+    )
+    from .config import (
+        BridgeConfig,
+        Defaults,
+        FirewallConfig,
+        FirewallRule,
+        InterfaceConfig,
+        Meta,
+        Network,
+        Node,
+        OSPFArea,
+        OSPFConfig,
+        RIPConfig,
+        RoutingConfig,
+        ServicesConfig,
+        StaticRoute,
+        Topology,
+        TunnelConfig,
+        VLANConfig,
+        WireguardConfig,
+        WireguardPeer,
+    )
+    from .converters import (
+        TopologyConverter,
+        convert_topology,
+    )
+    from .internal import (
+        InternalBridge,
+        InternalFirewall,
+        InternalFirewallRule,
+        InternalInterface,
+        InternalLink,
+        InternalNetwork,
+        InternalNode,
+        InternalOSPFArea,
+        InternalResources,
+        InternalRIP,
+        InternalRouting,
+        InternalServices,
+        InternalStaticRoute,
+        InternalSysctl,
+        InternalTopology,
+        InternalTunnel,
+        InternalVLAN,
+        InternalWireguard,
+        InternalWireguardPeer,
+        NicModel,
+        ifname_to_vbox_adapter_index,
+    )
+
+# Public names resolved on first access (PEP 562), so importing one submodule does not build every model
+_LAZY_IMPORTS: dict[str, str] = {
+    "load_topology": ".common",
+    "BridgeConfig": ".config",
+    "Defaults": ".config",
+    "FirewallConfig": ".config",
+    "FirewallRule": ".config",
+    "InterfaceConfig": ".config",
+    "Meta": ".config",
+    "Network": ".config",
+    "Node": ".config",
+    "OSPFArea": ".config",
+    "OSPFConfig": ".config",
+    "RIPConfig": ".config",
+    "RoutingConfig": ".config",
+    "ServicesConfig": ".config",
+    "StaticRoute": ".config",
+    "Topology": ".config",
+    "TunnelConfig": ".config",
+    "VLANConfig": ".config",
+    "WireguardConfig": ".config",
+    "WireguardPeer": ".config",
+    "TopologyConverter": ".converters",
+    "convert_topology": ".converters",
+    "InternalBridge": ".internal",
+    "InternalFirewall": ".internal",
+    "InternalFirewallRule": ".internal",
+    "InternalInterface": ".internal",
+    "InternalLink": ".internal",
+    "InternalNetwork": ".internal",
+    "InternalNode": ".internal",
+    "InternalOSPFArea": ".internal",
+    "InternalResources": ".internal",
+    "InternalRIP": ".internal",
+    "InternalRouting": ".internal",
+    "InternalServices": ".internal",
+    "InternalStaticRoute": ".internal",
+    "InternalSysctl": ".internal",
+    "InternalTopology": ".internal",
+    "InternalTunnel": ".internal",
+    "InternalVLAN": ".internal",
+    "InternalWireguard": ".internal",
+    "InternalWireguardPeer": ".internal",
+    "NicModel": ".internal",
+    "ifname_to_vbox_adapter_index": ".internal",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
 
 
 __all__ = [
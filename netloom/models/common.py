@@ -1,21 +1,37 @@
 """Common type annotations and utilities for topology models."""
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 from pydantic import ValidationError
 
-from .config import Topology
 
+if TYPE_CHECKING:
+    from .config import Topology
 
-def load_topology(path: str | Path) -> Topology:
-    """Load YAML topology file and validate against schema."""
 
-    p = Path(path)
-    data: dict[str, Any] = yaml.safe_load(p.read_text(encoding="utf-8"))
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+def load_topology(path: str | Path) -> "Topology":
+    """Load YAML (or JSON) topology file and validate against schema."""
 
+    # Imported here: building the config models is only needed once a topology is actually loaded
+    from .config import Topology
+
+    p = Path(path)
     try:
-        return Topology(**data)
+        if p.suffix.lower() == ".json":
+            # pydantic-core parses and validates in one pass, without an intermediate dict
+            return Topology.model_validate_json(p.read_bytes())
+
+        # Binary stream: the loader decodes UTF-8 itself instead of reading the whole file into a str first
+        with p.open("rb") as f:
+            data: dict[str, Any] = yaml.load(f, Loader=_YamlLoader)
+        return Topology.model_validate(data)
     except ValidationError as ve:
         raise SystemExit(f"[Topology Validation Error]\n{ve}") from ve
@@ -5,7 +5,7 @@ This module implements the ASVK Structured Topology schema.
 
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 from ..core.enums import (
     FirewallAction,
@@ -115,33 +115,16 @@ class InterfaceConfig(BaseModel):
     )
 
     @model_validator(mode="after")
-    def _loopback_no_network(self) -> "InterfaceConfig":
-        """Validate that loopback interface don't have network."""
-
-        if self.kind == InterfaceKind.LOOPBACK and self.network is not None:
-            raise ValueError("A 'loopback' interface cannot have 'network' set.")
-        return self
-
-    @model_validator(mode="after")
-    def _loopback_no_index(self) -> "InterfaceConfig":
-        """Validate that loopback interface don't have index."""
-
-        if self.kind == InterfaceKind.LOOPBACK and self.index is not None:
-            raise ValueError("A 'loopback' interface cannot have 'index' set.")
-        return self
-
-    @model_validator(mode="after")
-    def _loopback_no_nat(self) -> "InterfaceConfig":
-        """Validate that loopback interface don't have nat."""
-
-        if self.kind == InterfaceKind.LOOPBACK and self.nat:
-            raise ValueError("A 'loopback' interface cannot have 'nat' set.")
-        return self
-
-    @model_validator(mode="after")
-    def _nat_no_network(self) -> "InterfaceConfig":
-        """Validate that nat and network are mutually exclusive."""
-
+    def _check_kind_constraints(self) -> "InterfaceConfig":
+        """Validate loopback and NAT constraints in one pass (a loopback has no network, index or nat)."""
+
+        if self.kind == InterfaceKind.LOOPBACK:
+            if self.network is not None:
+                raise ValueError("A 'loopback' interface cannot have 'network' set.")
+            if self.index is not None:
+                raise ValueError("A 'loopback' interface cannot have 'index' set.")
+            if self.nat:
+                raise ValueError("A 'loopback' interface cannot have 'nat' set.")
         if self.nat and self.network is not None:
             raise ValueError("'nat' and 'network' are mutually exclusive.")
         return self
@@ -363,10 +346,18 @@ class Topology(BaseModel):
     nodes: list[Node]
     defaults: Defaults | None = None
 
+    # Internal index for fast lookup
+    _node_index: dict[str, Node] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Build indexes after initialization."""
+
+        # First definition wins, matching the linear scan this replaces
+        self._node_index = {}
+        for node in self.nodes:
+            self._node_index.setdefault(node.name, node)
+
     def get_node(self, name: str) -> Node | None:
         """Find a node by name."""
 
-        for node in self.nodes:
-            if node.name == name:
-                return node
-        return None
+        return self._node_index.get(name)
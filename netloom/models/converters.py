@@ -134,28 +134,26 @@ class TopologyConverter:
         routing = node.routing
 
         # Convert static routes
-        static_routes: list[InternalStaticRoute] = []
-        if routing.static:
-            for route in routing.static:
-                static_routes.append(InternalStaticRoute(destination=route.destination, gateway=route.gateway))
+        static_routes = [
+            InternalStaticRoute(destination=route.destination, gateway=route.gateway) for route in routing.static or ()
+        ]
 
         # Convert OSPF areas
         ospf_areas: list[InternalOSPFArea] = []
         ospf_enabled = False
         if routing.ospf:
             ospf_enabled = routing.ospf.enabled
-            if routing.ospf.areas:
-                for area in routing.ospf.areas:
-                    ospf_areas.append(
-                        InternalOSPFArea(
-                            id=area.id,
-                            interfaces=area.interfaces or [],
-                            hello=area.hello,
-                            dead=area.dead,
-                            cost=area.cost,
-                            retransmit=area.retransmit,
-                        )
-                    )
+            ospf_areas = [
+                InternalOSPFArea(
+                    id=area.id,
+                    interfaces=area.interfaces or [],
+                    hello=area.hello,
+                    dead=area.dead,
+                    cost=area.cost,
+                    retransmit=area.retransmit,
+                )
+                for area in routing.ospf.areas or ()
+            ]
 
         # Convert RIP configuration
         rip = None
@@ -185,18 +183,16 @@ class TopologyConverter:
         if not node.vlans:
             return []
 
-        vlans: list[InternalVLAN] = []
-        for vlan in node.vlans:
-            vlans.append(
-                InternalVLAN(
-                    id=vlan.id,
-                    parent=vlan.parent,
-                    name=vlan.name or f"{vlan.parent}-{vlan.id}",
-                    ip=vlan.ip,
-                    gateway=vlan.gateway,
-                )
+        return [
+            InternalVLAN(
+                id=vlan.id,
+                parent=vlan.parent,
+                name=vlan.name or f"{vlan.parent}-{vlan.id}",
+                ip=vlan.ip,
+                gateway=vlan.gateway,
             )
-        return vlans
+            for vlan in node.vlans
+        ]
 
     def _convert_tunnels(self, node: Node) -> list[InternalTunnel]:
         """Convert tunnel configs to internal format."""
@@ -204,18 +200,16 @@ class TopologyConverter:
         if not node.tunnels:
             return []
 
-        tunnels: list[InternalTunnel] = []
-        for tunnel in node.tunnels:
-            tunnels.append(
-                InternalTunnel(
-                    name=tunnel.name,
-                    type=tunnel.type,
-                    local=tunnel.local,
-                    remote=tunnel.remote,
-                    ip=tunnel.ip,
-                )
+        return [
+            InternalTunnel(
+                name=tunnel.name,
+                type=tunnel.type,
+                local=tunnel.local,
+                remote=tunnel.remote,
+                ip=tunnel.ip,
             )
-        return tunnels
+            for tunnel in node.tunnels
+        ]
 
     def _convert_services(self, node: Node) -> InternalServices | None:
         """Convert services config to internal format."""
@@ -229,18 +223,16 @@ class TopologyConverter:
         wireguard = None
         if services.wireguard and services.wireguard.private_key:
             wg = services.wireguard
-            peers: list[InternalWireguardPeer] = []
-            if wg.peers:
-                for peer in wg.peers:
-                    if peer.public_key and peer.allowed_ips:
-                        peers.append(
-                            InternalWireguardPeer(
-                                public_key=peer.public_key,
-                                allowed_ips=peer.allowed_ips,
-                                endpoint=peer.endpoint,
-                                keepalive=peer.keepalive,
-                            )
-                        )
+            peers = [
+                InternalWireguardPeer(
+                    public_key=peer.public_key,
+                    allowed_ips=peer.allowed_ips,
+                    endpoint=peer.endpoint,
+                    keepalive=peer.keepalive,
+                )
+                for peer in wg.peers or ()
+                if peer.public_key and peer.allowed_ips
+            ]
             if wg.listen_port and wg.address:
                 wireguard = InternalWireguard(
                     private_key=wg.private_key,  # ty:ignore[invalid-argument-type]
@@ -253,17 +245,16 @@ class TopologyConverter:
         firewall = None
         if services.firewall and services.firewall.rules:
             fw = services.firewall
-            rules: list[InternalFirewallRule] = []
-            for rule in fw.rules:  # ty:ignore[not-iterable]
-                rules.append(
-                    InternalFirewallRule(
-                        action=rule.action,
-                        src=rule.src,
-                        dst=rule.dst,
-                        proto=rule.proto,
-                        dport=rule.dport,
-                    )
+            rules = [
+                InternalFirewallRule(
+                    action=rule.action,
+                    src=rule.src,
+                    dst=rule.dst,
+                    proto=rule.proto,
+                    dport=rule.dport,
                 )
+                for rule in fw.rules  # ty:ignore[not-iterable]
+            ]
             firewall = InternalFirewall(
                 impl=fw.impl or FirewallImpl.NFTABLES,
                 rules=rules,
@@ -396,11 +387,12 @@ class TopologyConverter:
                     )
                 )
 
-        # Add standalone interfaces (no network, e.g. loopback, nat, none-mode)
+        # Single pass over the nodes: add standalone interfaces (no network, e.g. loopback,
+        # nat, none-mode) after the networked ones, then build the internal node
+        internal_nodes: list[InternalNode] = []
         for node in topo.nodes:
-            if not node.interfaces:
-                continue
-            for iface_name, iface_config in node.interfaces.items():
+            interfaces = node_interfaces[node.name]
+            for iface_name, iface_config in (node.interfaces or {}).items():
                 if iface_config.network is not None:
                     continue
 
@@ -408,7 +400,7 @@ class TopologyConverter:
                     # NAT mode: allocate a VirtualBox NIC slot, internet via host NAT
                     mac = iface_config.mac or generate_mac(seed=f"{topo_id}-{node.name}-{iface_name}")
                     vbox_nic_index = self._allocate_nic_index(node.name, iface_name, iface_config.index)
-                    node_interfaces[node.name].append(
+                    interfaces.append(
                         InternalInterface(
                             name=iface_name,
                             kind=iface_config.kind,
@@ -427,7 +419,7 @@ class TopologyConverter:
                     # None mode: physical interface, slot reserved but disconnected
                     mac = iface_config.mac or generate_mac(seed=f"{topo_id}-{node.name}-{iface_name}")
                     vbox_nic_index = self._allocate_nic_index(node.name, iface_name, iface_config.index)
-                    node_interfaces[node.name].append(
+                    interfaces.append(
                         InternalInterface(
                             name=iface_name,
                             kind=iface_config.kind,
@@ -443,7 +435,7 @@ class TopologyConverter:
 
                 else:
                     # Loopback interfaces have no VirtualBox NIC
-                    node_interfaces[node.name].append(
+                    interfaces.append(
                         InternalInterface(
                             name=iface_name,
                             kind=iface_config.kind,
@@ -455,10 +447,6 @@ class TopologyConverter:
                         )
                     )
 
-        # Build internal nodes
-        internal_nodes: list[InternalNode] = []
-        for node in topo.nodes:
-            interfaces = node_interfaces.get(node.name, [])
             vlans = self._convert_vlans(node)
 
             config_dir = f"{self.workdir}/configs/{node.name}"
@@ -4,17 +4,19 @@ from collections import deque
 from typing import TYPE_CHECKING
 
 from rich.box import ROUNDED
+from rich.console import Group
 from rich.panel import Panel
 from rich.table import Table
 from rich.tree import Tree
 
 from netloom.core.enums import NodeRole
-from netloom.models.internal import InternalTopology
 
 
 if TYPE_CHECKING:
     from rich.console import Console
 
+    from netloom.models.internal import InternalTopology
+
 ROLE_COLOR: dict[str, str] = {
     NodeRole.ROUTER: "cyan",
     NodeRole.SWITCH: "yellow",
@@ -28,7 +30,7 @@ def node_label(name: str, role: str, *, with_role: bool = True) -> str:
     return f"[{color}]{name}[/{color}]{role_part}"
 
 
-def render_map(internal: InternalTopology, console: "Console") -> None:
+def render_map(internal: "InternalTopology", console: "Console") -> None:
     """Render network-centric connectivity table."""
 
     table = Table(box=ROUNDED, show_header=True, border_style="dim", expand=False)
@@ -63,7 +65,7 @@ def render_map(internal: InternalTopology, console: "Console") -> None:
     )
 
 
-def render_graph(internal: InternalTopology, console: "Console") -> None:
+def render_graph(internal: "InternalTopology", console: "Console") -> None:
     """Render a BFS tree diagram of the topology."""
 
     adjacency: dict[str, list[tuple[str, str]]] = {n.name: [] for n in internal.nodes}
@@ -80,6 +82,7 @@ def render_graph(internal: InternalTopology, console: "Console") -> None:
                         adjacency[node_a].append((node_b, network.name))
 
     visited: set[str] = set()
+    trees: list[Tree] = []
     sorted_nodes = sorted(internal.nodes, key=lambda n: -len(adjacency[n.name]))
 
     for start in sorted_nodes:
@@ -102,4 +105,6 @@ def render_graph(internal: InternalTopology, console: "Console") -> None:
                 branch = parent_branch.add(f"{node_label(neighbor, node.role)}  [dim]via {net_name}[/dim]")
                 queue.append((neighbor, branch))
 
-        console.print(root_tree)
+        trees.append(root_tree)
+
+    console.print(Group(*trees))